@@ -27,10 +27,11 @@ from __future__ import annotations
 from lxml import etree
 
 from src.models import AnswerPayload
-from src.xml_utils import NAMESPACES, SECURE_PARSER
+from src.xml_utils import NAMESPACES
 
 from src.handlers.word_element_analysis import get_text
-from src.handlers.word_parser import read_document_xml
+from src.handlers.word_parser import get_body_element
+from src.handlers.word_writer import _validate_xpath
 
 
 def preview_answers(
@@ -46,11 +47,7 @@ def preview_answers(
         'pre-built XML' for insertion_xml)
       - status: 'ok' or 'warning' (if target already has content)
     """
-    doc_xml = read_document_xml(file_bytes)
-    root = etree.fromstring(doc_xml, SECURE_PARSER)
-    body = root.find("w:body", NAMESPACES)
-    if body is None:
-        raise ValueError("No <w:body> element found in document.xml")
+    body = get_body_element(file_bytes)
 
     previews: list[dict] = []
     for answer in answers:
@@ -60,6 +57,7 @@ def preview_answers(
 
 def _preview_single(body: etree._Element, answer: AnswerPayload) -> dict:
     """Build a preview dict for a single answer."""
+    _validate_xpath(answer.xpath)
     matched = body.xpath(answer.xpath, namespaces=NAMESPACES)
     if not matched:
         return {
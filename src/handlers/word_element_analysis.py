@@ -27,7 +27,7 @@ import re
 
 from lxml import etree
 
-from src.xml_utils import NAMESPACES
+from src.xml_utils import NAMESPACES, W_T
 
 W = NAMESPACES["w"]
 
@@ -41,11 +41,18 @@ COMPLEX_TAGS = {
 
 PLACEHOLDER_RE = re.compile(r"\[Enter[^\]]*\]|_{3,}")
 
+# The same placeholders as separate patterns, in priority order, for callers
+# that must prefer an [Enter ...] match over underscores in the same text.
+PLACEHOLDER_PATTERNS = (
+    re.compile(r"\[Enter[^\]]*\]"),
+    re.compile(r"_{3,}"),
+)
+
 
 def get_text(element: etree._Element) -> str:
     """Extract all text from w:t elements, joined with no separator."""
     parts: list[str] = []
-    for t_elem in element.iter(f"{{{W}}}t"):
+    for t_elem in element.iter(W_T):
         if t_elem.text:
             parts.append(t_elem.text)
     return "".join(parts)
@@ -23,20 +23,26 @@ like [Enter here] or ___.
 
 from __future__ import annotations
 
-import re
-
 from lxml import etree
 
 from src.models import FormField
-from src.xml_utils import NAMESPACES, SECURE_PARSER
+from src.xml_utils import (
+    NAMESPACES,
+    SECURE_PARSER,
+    W_P,
+    W_T,
+    W_TBL,
+    W_TC,
+    W_TR,
+)
 
-WORD_NAMESPACE_URI = NAMESPACES["w"]
+from src.handlers.word_element_analysis import PLACEHOLDER_PATTERNS
 
 
 def _get_context_text(element: etree._Element, max_chars: int = 100) -> str:
     """Get text content from an element, truncated for human review context."""
     texts: list[str] = []
-    for t_elem in element.iter(f"{{{WORD_NAMESPACE_URI}}}t"):
+    for t_elem in element.iter(W_T):
         if t_elem.text:
             texts.append(t_elem.text)
     text = " ".join(texts)
@@ -55,12 +61,14 @@ def _find_empty_table_cells(
     fields: list[FormField] = []
     counter = start_id
 
-    for tbl in body.iter(f"{{{WORD_NAMESPACE_URI}}}tbl"):
-        for tr in tbl.iter(f"{{{WORD_NAMESPACE_URI}}}tr"):
-            cells = list(tr.iter(f"{{{WORD_NAMESPACE_URI}}}tc"))
-            for i in range(len(cells) - 1):
-                q_text = _get_context_text(cells[i]).strip()
-                a_text = _get_context_text(cells[i + 1]).strip()
+    for tbl in body.iter(W_TBL):
+        for tr in tbl.iter(W_TR):
+            # Each cell's text is read once, then compared with its neighbour
+            texts = [
+                _get_context_text(tc).strip()
+                for tc in tr.iter(W_TC)
+            ]
+            for q_text, a_text in zip(texts, texts[1:]):
                 if q_text and not a_text:
                     counter += 1
                     fields.append(FormField(
@@ -79,16 +87,12 @@ def _find_placeholder_paragraphs(
 
     Returns the list of detected placeholder fields.
     """
-    placeholder_patterns = [
-        re.compile(r"\[Enter[^\]]*\]"),
-        re.compile(r"_{3,}"),
-    ]
     fields: list[FormField] = []
     counter = start_id
 
-    for p_elem in body.iter(f"{{{WORD_NAMESPACE_URI}}}p"):
+    for p_elem in body.iter(W_P):
         p_text = _get_context_text(p_elem)
-        for pattern in placeholder_patterns:
+        for pattern in PLACEHOLDER_PATTERNS:
             match = pattern.search(p_text)
             if match:
                 counter += 1
@@ -27,13 +27,10 @@ The output is a few KB instead of ~134KB of raw OOXML.
 
 from __future__ import annotations
 
-import zipfile
-from io import BytesIO
-
 from lxml import etree
 
 from src.models import CompactStructureResponse
-from src.xml_utils import NAMESPACES, SECURE_PARSER, build_xpath
+from src.xml_utils import NAMESPACES, build_xpath
 
 from src.handlers.word_element_analysis import (
     detect_complex,
@@ -42,6 +39,7 @@ from src.handlers.word_element_analysis import (
     get_text,
     is_answer_target,
 )
+from src.handlers.word_parser import get_body_element
 
 
 def extract_structure_compact(file_bytes: bytes) -> CompactStructureResponse:
@@ -51,7 +49,7 @@ def extract_structure_compact(file_bytes: bytes) -> CompactStructureResponse:
     Returns CompactStructureResponse with compact_text, id_to_xpath, and
     complex_elements.
     """
-    body = _parse_body(file_bytes)
+    body = get_body_element(file_bytes)
     lines: list[str] = []
     id_to_xpath: dict[str, str] = {}
     complex_elements: list[str] = []
@@ -80,17 +78,6 @@ def extract_structure_compact(file_bytes: bytes) -> CompactStructureResponse:
     )
 
 
-def _parse_body(file_bytes: bytes) -> etree._Element:
-    """Extract and parse <w:body> from a .docx file."""
-    with zipfile.ZipFile(BytesIO(file_bytes)) as zf:
-        doc_xml = zf.read("word/document.xml")
-    root = etree.fromstring(doc_xml, SECURE_PARSER)
-    body = root.find("w:body", NAMESPACES)
-    if body is None:
-        raise ValueError("No <w:body> element found in document.xml")
-    return body
-
-
 def _index_table(
     tbl: etree._Element,
     tbl_num: int,
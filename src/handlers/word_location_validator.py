@@ -31,11 +31,11 @@ from src.models import (
     LocationStatus,
     ValidatedLocation,
 )
-from src.xml_utils import NAMESPACES, SECURE_PARSER, find_snippet_in_body
+from src.xml_utils import NAMESPACES, SnippetIndex, find_snippet_in_tree
 
 from src.handlers.word_element_analysis import get_text, is_answer_target
 from src.handlers.word_fields import _get_context_text
-from src.handlers.word_parser import get_body_xml
+from src.handlers.word_parser import get_body_element
 
 # Matches element IDs from compact extraction: T1-R2-C2 or P5
 ELEMENT_ID_RE = re.compile(r"^(T\d+-R\d+-C\d+|P\d+)$")
@@ -54,8 +54,7 @@ def validate_locations(
 
     Accepts element IDs (T1-R2-C2, P5) or OOXML snippets.
     """
-    body_xml = get_body_xml(file_bytes)
-    body_root = etree.fromstring(body_xml.encode("utf-8"), SECURE_PARSER)
+    body_root = get_body_element(file_bytes)
 
     # Build id_to_xpath mapping once if any location is an element ID
     id_to_xpath: dict[str, str] | None = None
@@ -64,6 +63,7 @@ def validate_locations(
         compact = extract_structure_compact(file_bytes)
         id_to_xpath = compact.id_to_xpath
 
+    snippet_index: SnippetIndex = {}
     results: list[ValidatedLocation] = []
     for loc in locations:
         if _is_element_id(loc.snippet):
@@ -72,7 +72,7 @@ def validate_locations(
             )
         else:
             results.append(
-                _validate_snippet(loc, body_xml, body_root)
+                _validate_snippet(loc, body_root, snippet_index)
             )
 
     return results
@@ -152,11 +152,15 @@ def _suggest_answer_cell(
 
 def _validate_snippet(
     loc: LocationSnippet,
-    body_xml: str,
     body_root: etree._Element,
+    snippet_index: SnippetIndex,
 ) -> ValidatedLocation:
-    """Validate a location by searching for its OOXML snippet in the document."""
-    xpaths = find_snippet_in_body(body_xml, loc.snippet)
+    """Validate a location by searching for its OOXML snippet in the document.
+
+    snippet_index is shared across one validate_locations call so each
+    element type in the body is keyed only once.
+    """
+    xpaths = find_snippet_in_tree(body_root, loc.snippet, snippet_index)
 
     if len(xpaths) == 0:
         return ValidatedLocation(
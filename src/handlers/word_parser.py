@@ -16,7 +16,8 @@
 
 """Word (.docx) XML extraction — read document.xml from a .docx archive.
 
-Shared by word.py, word_verifier.py, and word_location_validator.py.
+Shared by word.py, word_indexer.py, word_verifier.py, word_dry_run.py, and
+word_location_validator.py.
 Provides the low-level .docx-to-XML extraction that all Word handlers need.
 """
 
@@ -36,11 +37,24 @@ def read_document_xml(file_bytes: bytes) -> bytes:
         return zf.read("word/document.xml")
 
 
-def get_body_xml(file_bytes: bytes) -> str:
-    """Extract the <w:body> XML string from a .docx file."""
+def get_body_element(file_bytes: bytes) -> etree._Element:
+    """Parse a .docx and return its <w:body> element.
+
+    For callers that work on the tree directly; avoids serializing the body
+    to a string and parsing it straight back.
+    """
     doc_xml = read_document_xml(file_bytes)
     root = etree.fromstring(doc_xml, SECURE_PARSER)
     body = root.find("w:body", NAMESPACES)
     if body is None:
         raise ValueError("No <w:body> element found in document.xml")
-    return etree.tostring(body, encoding="unicode")
+    return body
+
+
+def get_body_xml(file_bytes: bytes) -> str:
+    """Extract the <w:body> XML string from a .docx file.
+
+    The body's tail (whitespace before </w:document>) is not part of it.
+    """
+    body = get_body_element(file_bytes)
+    return etree.tostring(body, encoding="unicode", with_tail=False)
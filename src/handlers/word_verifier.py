@@ -32,17 +32,16 @@ from src.models import (
     VerificationReport,
 )
 from src.verification import build_verification_summary
-from src.xml_utils import NAMESPACES, SECURE_PARSER
+from src.xml_utils import NAMESPACES, W_P, W_R, W_T, W_TC
 
-from src.handlers.word_parser import read_document_xml
-
-WORD_NAMESPACE_URI = NAMESPACES["w"]
+from src.handlers.word_parser import get_body_element
+from src.handlers.word_writer import _validate_xpath
 
 
 def _extract_text(element: etree._Element) -> str:
     """Extract concatenated text from all w:t elements under element."""
     texts: list[str] = []
-    for t_elem in element.iter(f"{{{WORD_NAMESPACE_URI}}}t"):
+    for t_elem in element.iter(W_T):
         if t_elem.text:
             texts.append(t_elem.text)
     return " ".join(texts)
@@ -57,17 +56,15 @@ def _check_structural_issues(body: etree._Element) -> list[str]:
     """
     issues: list[str] = []
 
-    for tc in body.iter(f"{{{WORD_NAMESPACE_URI}}}tc"):
-        for child in tc:
-            if child.tag == f"{{{WORD_NAMESPACE_URI}}}r":
-                context = _extract_text(tc)[:50]
-                issues.append(
-                    f"Bare <w:r> found directly under <w:tc>"
-                    f" (context: {context!r})"
-                )
-
-        paras = tc.findall(f"{{{WORD_NAMESPACE_URI}}}p")
-        if not paras:
+    for tc in body.iter(W_TC):
+        for _ in tc.iterchildren(W_R):
+            context = _extract_text(tc)[:50]
+            issues.append(
+                f"Bare <w:r> found directly under <w:tc>"
+                f" (context: {context!r})"
+            )
+
+        if tc.find(W_P) is None:
             context = _extract_text(tc)[:50]
             issues.append(
                 f"<w:tc> has no <w:p> child (context: {context!r})"
@@ -83,6 +80,7 @@ def _verify_content(
     results: list[ContentResult] = []
 
     for answer in expected_answers:
+        _validate_xpath(answer.xpath)
         matched = body.xpath(answer.xpath, namespaces=NAMESPACES)
         if not matched:
             results.append(ContentResult(
@@ -120,11 +118,7 @@ def verify_output(
     Returns a report with structural issues, per-answer content results,
     and a summary with counts.
     """
-    doc_xml = read_document_xml(file_bytes)
-    root = etree.fromstring(doc_xml, SECURE_PARSER)
-    body = root.find("w:body", NAMESPACES)
-    if body is None:
-        raise ValueError("No <w:body> element found in document.xml")
+    body = get_body_element(file_bytes)
 
     structural_issues = _check_structural_issues(body)
     content_results = _verify_content(body, expected_answers)
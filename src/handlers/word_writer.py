@@ -33,12 +33,18 @@ from src.models import AnswerPayload, InsertionMode
 from src.xml_utils import (
     NAMESPACES,
     SECURE_PARSER,
-    build_run_xml,
+    W_P,
+    W_PPR,
+    W_R,
+    W_T,
+    W_TC,
+    W_TCPR,
+    build_run_element,
     extract_formatting_from_element,
     parse_snippet,
 )
 
-WORD_NAMESPACE_URI = NAMESPACES["w"]
+from src.handlers.word_element_analysis import PLACEHOLDER_PATTERNS
 
 # Allowed XPath pattern: positional steps using OOXML element names only
 _XPATH_SAFE_RE = re.compile(
@@ -46,63 +52,58 @@ _XPATH_SAFE_RE = re.compile(
 )
 
 
-def _replace_content(target: etree._Element, insertion_xml: str) -> None:
-    """Clear existing content in target and insert new XML.
+def _replace_content(
+    target: etree._Element, new_elem: etree._Element | None
+) -> None:
+    """Clear existing content in target and insert new_elem.
 
     Preserves w:pPr/w:tcPr property elements. When the target is a w:tc,
     wraps bare w:r elements in a w:p (OOXML requires runs inside paragraphs).
     """
-    preserve_tags = {
-        f"{{{WORD_NAMESPACE_URI}}}pPr",
-        f"{{{WORD_NAMESPACE_URI}}}tcPr",
-    }
+    preserve_tags = {W_PPR, W_TCPR}
     for child in list(target):
         if child.tag not in preserve_tags:
             target.remove(child)
     target.text = None
 
-    new_elem = parse_snippet(insertion_xml)
     if new_elem is None:
         return
 
-    is_table_cell = target.tag == f"{{{WORD_NAMESPACE_URI}}}tc"
-    is_run = new_elem.tag == f"{{{WORD_NAMESPACE_URI}}}r"
+    is_table_cell = target.tag == W_TC
+    is_run = new_elem.tag == W_R
 
     if is_table_cell and is_run:
-        para = etree.Element(f"{{{WORD_NAMESPACE_URI}}}p")
+        para = etree.Element(W_P)
         para.append(new_elem)
         target.append(para)
     else:
         target.append(new_elem)
 
 
-def _append_content(target: etree._Element, insertion_xml: str) -> None:
-    """Append new content after existing content in target."""
-    new_elem = parse_snippet(insertion_xml)
+def _append_content(
+    target: etree._Element, new_elem: etree._Element | None
+) -> None:
+    """Append new_elem after existing content in target."""
     if new_elem is not None:
         target.append(new_elem)
 
 
 def _replace_placeholder(
-    target: etree._Element, insertion_xml: str, placeholder: str | None = None
+    target: etree._Element,
+    new_elem: etree._Element | None,
+    placeholder: str | None = None,
 ) -> None:
-    """Find placeholder text in the target and replace it.
+    """Find placeholder text in the target and replace it with new_elem's text.
 
     Without a specific placeholder, matches: [Enter ...], ___ (3+ underscores).
     """
-    placeholder_patterns = [
-        re.compile(r"\[Enter[^\]]*\]"),
-        re.compile(r"_{3,}"),
-    ]
-
-    new_elem = parse_snippet(insertion_xml)
     if new_elem is None:
         return
 
-    new_text_elem = new_elem.find(f".//{{{WORD_NAMESPACE_URI}}}t")
+    new_text_elem = new_elem.find(f".//{W_T}")
     new_text = new_text_elem.text if new_text_elem is not None else ""
 
-    for t_elem in target.iter(f"{{{WORD_NAMESPACE_URI}}}t"):
+    for t_elem in target.iter(W_T):
         if t_elem.text is None:
             continue
 
@@ -111,7 +112,7 @@ def _replace_placeholder(
                 t_elem.text = t_elem.text.replace(placeholder, new_text)
                 return
         else:
-            for pattern in placeholder_patterns:
+            for pattern in PLACEHOLDER_PATTERNS:
                 match = pattern.search(t_elem.text)
                 if match:
                     t_elem.text = pattern.sub(new_text, t_elem.text)
@@ -127,7 +128,7 @@ def _repackage_docx_zip(file_bytes: bytes, modified_xml: bytes) -> bytes:
                 if item.filename == "word/document.xml":
                     zf_out.writestr(item, modified_xml)
                 else:
-                    zf_out.writestr(item, zf_in.read(item.filename))
+                    zf_out.writestr(item, zf_in.read(item))
     return output.getvalue()
 
 
@@ -137,16 +138,16 @@ def _validate_xpath(xpath: str) -> None:
         raise ValueError(f"XPath does not match expected pattern: {xpath!r}")
 
 
-def _build_insertion_xml_for_answer_text(
+def _build_insertion_element_for_answer_text(
     target: etree._Element, answer_text: str
-) -> str:
-    """Build insertion OOXML from plain text, inheriting formatting from target.
+) -> etree._Element:
+    """Build the insertion run from plain text, inheriting target formatting.
 
-    This is the fast path: the server builds the same XML that the
-    build_insertion_xml MCP tool would produce, without an extra round-trip.
+    This is the fast path: the same run the build_insertion_xml MCP tool
+    would produce, handed to the tree without a serialize/parse round-trip.
     """
     formatting = extract_formatting_from_element(target)
-    return build_run_xml(answer_text, formatting)
+    return build_run_element(answer_text, formatting)
 
 
 def _apply_answer(body: etree._Element, answer: AnswerPayload) -> None:
@@ -160,20 +161,20 @@ def _apply_answer(body: etree._Element, answer: AnswerPayload) -> None:
         )
     target = matched[0]
 
-    # Fast path: build insertion XML from answer_text when provided
+    # Fast path: build the run element from answer_text when provided
     if answer.answer_text is not None and answer.answer_text.strip():
-        insertion_xml = _build_insertion_xml_for_answer_text(
+        new_elem = _build_insertion_element_for_answer_text(
             target, answer.answer_text
         )
     else:
-        insertion_xml = answer.insertion_xml
+        new_elem = parse_snippet(answer.insertion_xml)
 
     if answer.mode == InsertionMode.REPLACE_CONTENT:
-        _replace_content(target, insertion_xml)
+        _replace_content(target, new_elem)
     elif answer.mode == InsertionMode.APPEND:
-        _append_content(target, insertion_xml)
+        _append_content(target, new_elem)
     elif answer.mode == InsertionMode.REPLACE_PLACEHOLDER:
-        _replace_placeholder(target, insertion_xml)
+        _replace_placeholder(target, new_elem)
 
 
 def write_answers(
@@ -14,18 +14,45 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-"""OOXML formatting — extract formatting from elements and build formatted runs.
+"""OOXML formatting — extract run formatting from existing document elements.
 
 Used by word.py to implement build_insertion_xml (formatting inheritance for
-plain text answers). Extraction reads formatting properties from existing
-document elements; building creates new OOXML runs with those properties.
+plain text answers). The extracted dict is what xml_run_builder applies to
+new runs.
 """
 
 from __future__ import annotations
 
 from lxml import etree
 
-from src.xml_snippet_matching import NAMESPACES, SECURE_PARSER
+from src.xml_snippet_matching import (
+    NAMESPACES,
+    SECURE_PARSER,
+    W_ASCII,
+    W_B,
+    W_COLOR,
+    W_CS,
+    W_EASTASIA,
+    W_HANSI,
+    W_I,
+    W_PPR,
+    W_R,
+    W_RFONTS,
+    W_RPR,
+    W_SZ,
+    W_SZCS,
+    W_U,
+    W_VAL,
+)
+
+# Formatting dict keys paired with the rPr attribute or element they come from
+FONT_ATTRS = (
+    ("font_ascii", W_ASCII),
+    ("font_hAnsi", W_HANSI),
+    ("font_cs", W_CS),
+    ("font_eastAsia", W_EASTASIA),
+)
+VALUE_TAGS = (("sz", W_SZ), ("szCs", W_SZCS), ("color", W_COLOR))
 
 
 def _find_run_properties(elem: etree._Element) -> etree._Element | None:
@@ -34,75 +61,72 @@ def _find_run_properties(elem: etree._Element) -> etree._Element | None:
     Searches in order: direct child rPr (if element is a run), first run's
     rPr (if element is a paragraph), paragraph-level rPr inside pPr.
     """
-    rpr = elem.find("w:rPr", NAMESPACES)
+    rpr = elem.find(W_RPR)
     if rpr is not None:
         return rpr
 
-    first_run = elem.find(".//w:r", NAMESPACES)
+    first_run = next(elem.iterdescendants(W_R), None)
     if first_run is not None:
-        rpr = first_run.find("w:rPr", NAMESPACES)
+        rpr = first_run.find(W_RPR)
         if rpr is not None:
             return rpr
 
-    ppr = elem.find("w:pPr", NAMESPACES)
+    ppr = elem.find(W_PPR)
     if ppr is not None:
-        return ppr.find("w:rPr", NAMESPACES)
+        return ppr.find(W_RPR)
 
     return None
 
 
-def _extract_font_properties(rpr: etree._Element) -> dict:
+def _index_properties(rpr: etree._Element) -> dict[str, etree._Element]:
+    """Map each property tag in rPr to its first element, in one pass.
+
+    The extractors below look properties up here instead of running a
+    separate find() per property.
+    """
+    props: dict[str, etree._Element] = {}
+    for child in rpr:
+        props.setdefault(child.tag, child)
+    return props
+
+
+def _extract_font_properties(props: dict[str, etree._Element]) -> dict:
     """Extract font family properties (ascii, hAnsi, cs, eastAsia) from rPr."""
     formatting: dict = {}
-    rfonts = rpr.find("w:rFonts", NAMESPACES)
+    rfonts = props.get(W_RFONTS)
     if rfonts is not None:
-        w_ns = NAMESPACES["w"]
-        for attr_name in ("ascii", "hAnsi", "cs", "eastAsia"):
-            val = rfonts.get(f"{{{w_ns}}}{attr_name}")
+        for key, attr in FONT_ATTRS:
+            val = rfonts.get(attr)
             if val is not None:
-                formatting[f"font_{attr_name}"] = val
+                formatting[key] = val
     return formatting
 
 
-def _extract_size_and_color(rpr: etree._Element) -> dict:
+def _extract_size_and_color(props: dict[str, etree._Element]) -> dict:
     """Extract font size (sz, szCs) and text color from rPr."""
     formatting: dict = {}
-    w_ns = NAMESPACES["w"]
-
-    sz = rpr.find("w:sz", NAMESPACES)
-    if sz is not None:
-        val = sz.get(f"{{{w_ns}}}val")
-        if val is not None:
-            formatting["sz"] = val
-
-    sz_cs = rpr.find("w:szCs", NAMESPACES)
-    if sz_cs is not None:
-        val = sz_cs.get(f"{{{w_ns}}}val")
-        if val is not None:
-            formatting["szCs"] = val
-
-    color = rpr.find("w:color", NAMESPACES)
-    if color is not None:
-        val = color.get(f"{{{w_ns}}}val")
-        if val is not None:
-            formatting["color"] = val
-
+    for key, tag in VALUE_TAGS:
+        elem = props.get(tag)
+        if elem is not None:
+            val = elem.get(W_VAL)
+            if val is not None:
+                formatting[key] = val
     return formatting
 
 
-def _extract_style_properties(rpr: etree._Element) -> dict:
+def _extract_style_properties(props: dict[str, etree._Element]) -> dict:
     """Extract bold, italic, and underline properties from rPr."""
     formatting: dict = {}
 
-    if rpr.find("w:b", NAMESPACES) is not None:
+    if W_B in props:
         formatting["bold"] = True
 
-    if rpr.find("w:i", NAMESPACES) is not None:
+    if W_I in props:
         formatting["italic"] = True
 
-    u_elem = rpr.find("w:u", NAMESPACES)
+    u_elem = props.get(W_U)
     if u_elem is not None:
-        val = u_elem.get(f'{{{NAMESPACES["w"]}}}val')
+        val = u_elem.get(W_VAL)
         formatting["underline"] = val or "single"
 
     return formatting
@@ -138,10 +162,11 @@ def extract_formatting_from_element(elem: etree._Element) -> dict:
     if rpr is None:
         return {}
 
+    props = _index_properties(rpr)
     formatting: dict = {}
-    formatting.update(_extract_font_properties(rpr))
-    formatting.update(_extract_size_and_color(rpr))
-    formatting.update(_extract_style_properties(rpr))
+    formatting.update(_extract_font_properties(props))
+    formatting.update(_extract_size_and_color(props))
+    formatting.update(_extract_style_properties(props))
     return formatting
 
 
@@ -154,75 +179,3 @@ def extract_formatting(element_xml: str) -> dict:
     """
     elem = _parse_element_xml(element_xml)
     return extract_formatting_from_element(elem)
-
-
-def _apply_font_properties(rpr: etree._Element, formatting: dict) -> None:
-    """Add <w:rFonts> to rPr from formatting dict."""
-    w = NAMESPACES["w"]
-    font_attrs = {}
-    for key in ("font_ascii", "font_hAnsi", "font_cs", "font_eastAsia"):
-        if key in formatting:
-            attr_name = key.replace("font_", "")
-            font_attrs[f"{{{w}}}{attr_name}"] = formatting[key]
-    if font_attrs:
-        etree.SubElement(rpr, f"{{{w}}}rFonts", font_attrs)
-
-
-def _apply_style_properties(rpr: etree._Element, formatting: dict) -> None:
-    """Add bold, italic, and underline elements to rPr from formatting dict."""
-    w = NAMESPACES["w"]
-    if formatting.get("bold"):
-        etree.SubElement(rpr, f"{{{w}}}b")
-    if formatting.get("italic"):
-        etree.SubElement(rpr, f"{{{w}}}i")
-    if "underline" in formatting:
-        etree.SubElement(rpr, f"{{{w}}}u", {f"{{{w}}}val": formatting["underline"]})
-
-
-def _apply_size_and_color(rpr: etree._Element, formatting: dict) -> None:
-    """Add size (sz, szCs) and color elements to rPr from formatting dict."""
-    w = NAMESPACES["w"]
-    if "sz" in formatting:
-        etree.SubElement(rpr, f"{{{w}}}sz", {f"{{{w}}}val": formatting["sz"]})
-    if "szCs" in formatting:
-        etree.SubElement(rpr, f"{{{w}}}szCs", {f"{{{w}}}val": formatting["szCs"]})
-    if "color" in formatting:
-        etree.SubElement(rpr, f"{{{w}}}color", {f"{{{w}}}val": formatting["color"]})
-
-
-def _add_text_element(parent: etree._Element, text: str) -> None:
-    """Add a <w:t> element to parent, setting xml:space="preserve" when needed."""
-    w = NAMESPACES["w"]
-    t_elem = etree.SubElement(parent, f"{{{w}}}t")
-    t_elem.text = text
-    if text and (text[0] == " " or text[-1] == " "):
-        t_elem.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
-
-
-def build_run_xml(text: str, formatting: dict) -> str:
-    """Build a <w:r> element with the given text and inherited formatting.
-
-    Normalises both literal escaped '\\n' (backslash + n, as sent by some
-    LLMs like Gemini) and real newline characters (0x0A) into <w:br/>
-    elements, producing the same output as pressing Enter in Word.
-
-    Returns a string of well-formed OOXML.
-    """
-    w = NAMESPACES["w"]
-    r_elem = etree.Element(f"{{{w}}}r")
-
-    if formatting:
-        rpr = etree.SubElement(r_elem, f"{{{w}}}rPr")
-        _apply_font_properties(rpr, formatting)
-        _apply_style_properties(rpr, formatting)
-        _apply_size_and_color(rpr, formatting)
-
-    # Normalise literal escaped '\n' (two chars) to real newline before split
-    normalised = text.replace("\\n", "\n")
-    segments = normalised.split("\n")
-    _add_text_element(r_elem, segments[0])
-    for segment in segments[1:]:
-        etree.SubElement(r_elem, f"{{{w}}}br")
-        _add_text_element(r_elem, segment)
-
-    return etree.tostring(r_elem, encoding="unicode")
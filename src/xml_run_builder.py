@@ -0,0 +1,112 @@
+# Copyright (C) 2025 the contributors
+# SPDX-License-Identifier: AGPL-3.0-or-later
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""OOXML run building — create formatted <w:r> runs for answer text.
+
+Used by word.py to implement build_insertion_xml and by word_writer.py for
+the answer_text fast path. Applies a formatting dict (as produced by
+xml_formatting.extract_formatting) to a new run and splits the text on
+newlines into <w:t>/<w:br/> pairs.
+"""
+
+from __future__ import annotations
+
+from lxml import etree
+
+from src.xml_formatting import FONT_ATTRS, VALUE_TAGS
+from src.xml_snippet_matching import (
+    W_B,
+    W_BR,
+    W_I,
+    W_R,
+    W_RFONTS,
+    W_RPR,
+    W_T,
+    W_U,
+    W_VAL,
+)
+
+
+def _apply_font_properties(rpr: etree._Element, formatting: dict) -> None:
+    """Add <w:rFonts> to rPr from formatting dict."""
+    font_attrs = {}
+    for key, attr in FONT_ATTRS:
+        if key in formatting:
+            font_attrs[attr] = formatting[key]
+    if font_attrs:
+        etree.SubElement(rpr, W_RFONTS, font_attrs)
+
+
+def _apply_style_properties(rpr: etree._Element, formatting: dict) -> None:
+    """Add bold, italic, and underline elements to rPr from formatting dict."""
+    if formatting.get("bold"):
+        etree.SubElement(rpr, W_B)
+    if formatting.get("italic"):
+        etree.SubElement(rpr, W_I)
+    if "underline" in formatting:
+        etree.SubElement(rpr, W_U, {W_VAL: formatting["underline"]})
+
+
+def _apply_size_and_color(rpr: etree._Element, formatting: dict) -> None:
+    """Add size (sz, szCs) and color elements to rPr from formatting dict."""
+    for key, tag in VALUE_TAGS:
+        if key in formatting:
+            etree.SubElement(rpr, tag, {W_VAL: formatting[key]})
+
+
+def _add_text_element(parent: etree._Element, text: str) -> None:
+    """Add a <w:t> element to parent, setting xml:space="preserve" when needed."""
+    t_elem = etree.SubElement(parent, W_T)
+    t_elem.text = text
+    if text and (text[0] == " " or text[-1] == " "):
+        t_elem.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+
+
+def build_run_element(text: str, formatting: dict) -> etree._Element:
+    """Build a <w:r> element with the given text and inherited formatting.
+
+    Normalises both literal escaped '\\n' (backslash + n, as sent by some
+    LLMs like Gemini) and real newline characters (0x0A) into <w:br/>
+    elements, producing the same output as pressing Enter in Word.
+
+    Returns the element itself, for callers that insert it into a tree.
+    """
+    r_elem = etree.Element(W_R)
+
+    if formatting:
+        rpr = etree.SubElement(r_elem, W_RPR)
+        _apply_font_properties(rpr, formatting)
+        _apply_style_properties(rpr, formatting)
+        _apply_size_and_color(rpr, formatting)
+
+    # Normalise literal escaped '\n' (two chars) to real newline before split
+    normalised = text.replace("\\n", "\n")
+    segments = normalised.split("\n")
+    _add_text_element(r_elem, segments[0])
+    for segment in segments[1:]:
+        etree.SubElement(r_elem, W_BR)
+        _add_text_element(r_elem, segment)
+
+    return r_elem
+
+
+def build_run_xml(text: str, formatting: dict) -> str:
+    """Build a <w:r> run as in build_run_element() and return it as OOXML.
+
+    Returns a string of well-formed OOXML.
+    """
+    run = build_run_element(text, formatting)
+    return etree.tostring(run, encoding="unicode")
@@ -32,6 +32,30 @@ NAMESPACES = {
     "wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing",
 }
 
+# Clark-notation WordprocessingML tags/attributes, built once for hot lookups
+W_TBL = f"{{{NAMESPACES['w']}}}tbl"
+W_TR = f"{{{NAMESPACES['w']}}}tr"
+W_TC = f"{{{NAMESPACES['w']}}}tc"
+W_TCPR = f"{{{NAMESPACES['w']}}}tcPr"
+W_P = f"{{{NAMESPACES['w']}}}p"
+W_PPR = f"{{{NAMESPACES['w']}}}pPr"
+W_R = f"{{{NAMESPACES['w']}}}r"
+W_RPR = f"{{{NAMESPACES['w']}}}rPr"
+W_T = f"{{{NAMESPACES['w']}}}t"
+W_BR = f"{{{NAMESPACES['w']}}}br"
+W_RFONTS = f"{{{NAMESPACES['w']}}}rFonts"
+W_SZ = f"{{{NAMESPACES['w']}}}sz"
+W_SZCS = f"{{{NAMESPACES['w']}}}szCs"
+W_COLOR = f"{{{NAMESPACES['w']}}}color"
+W_B = f"{{{NAMESPACES['w']}}}b"
+W_I = f"{{{NAMESPACES['w']}}}i"
+W_U = f"{{{NAMESPACES['w']}}}u"
+W_VAL = f"{{{NAMESPACES['w']}}}val"
+W_ASCII = f"{{{NAMESPACES['w']}}}ascii"
+W_HANSI = f"{{{NAMESPACES['w']}}}hAnsi"
+W_CS = f"{{{NAMESPACES['w']}}}cs"
+W_EASTASIA = f"{{{NAMESPACES['w']}}}eastAsia"
+
 # Secure XML parser — disables external entities and network access (XXE prevention)
 SECURE_PARSER = etree.XMLParser(
     resolve_entities=False,
@@ -43,6 +67,8 @@ SECURE_PARSER = etree.XMLParser(
 # Reverse mapping: full URI -> prefix
 _URI_TO_PREFIX = {v: k for k, v in NAMESPACES.items()}
 
+SnippetIndex = dict[str, dict[tuple, list[etree._Element]]]  # tag -> key -> elems
+
 
 def parse_snippet(snippet: str) -> etree._Element | None:
     """Parse an OOXML snippet string into an lxml element.
@@ -81,10 +107,7 @@ def build_xpath(element: etree._Element, root: etree._Element) -> str:
         if tag.startswith("{"):
             uri, local = tag[1:].split("}", 1)
             prefix = _URI_TO_PREFIX.get(uri)
-            if prefix:
-                qname = f"{prefix}:{local}"
-            else:
-                qname = local
+            qname = f"{prefix}:{local}" if prefix else local
         else:
             qname = tag
 
@@ -103,61 +126,71 @@ def build_xpath(element: etree._Element, root: etree._Element) -> str:
     return "./" + "/".join(parts)
 
 
-def _elements_structurally_equal(a: etree._Element, b: etree._Element) -> bool:
-    """Recursively compare two lxml elements for structural equality.
+def _structural_key(elem: etree._Element) -> tuple:
+    """Build a hashable key describing *elem*'s structure.
 
-    Ignores namespace declarations (which vary depending on tree context)
-    and normalises whitespace in text content.
+    Two elements have equal keys exactly when they match structurally:
+    same tag, attributes, whitespace-stripped text/tail, and children in
+    order. Namespace declarations are not part of the key, since they vary
+    depending on tree context.
     """
-    if a.tag != b.tag:
-        return False
-
-    if dict(a.attrib) != dict(b.attrib):
-        return False
-
-    a_text = (a.text or "").strip()
-    b_text = (b.text or "").strip()
-    if a_text != b_text:
-        return False
-
-    a_tail = (a.tail or "").strip()
-    b_tail = (b.tail or "").strip()
-    if a_tail != b_tail:
-        return False
-
-    a_children = list(a)
-    b_children = list(b)
-    if len(a_children) != len(b_children):
-        return False
-
-    return all(
-        _elements_structurally_equal(ac, bc)
-        for ac, bc in zip(a_children, b_children)
+    return (
+        elem.tag,
+        tuple(sorted(elem.attrib.items())),
+        (elem.text or "").strip(),
+        (elem.tail or "").strip(),
+        tuple(_structural_key(child) for child in elem),
     )
 
 
-def find_snippet_in_body(body_xml: str, snippet: str) -> list[str]:
-    """Find all XPaths where *snippet* matches within the document body.
+def _index_by_structure(
+    body_root: etree._Element, tag: str
+) -> dict[tuple, list[etree._Element]]:
+    """Group every *tag* element under body_root by its structural key."""
+    index: dict[tuple, list[etree._Element]] = {}
+    for elem in body_root.iter(tag):
+        index.setdefault(_structural_key(elem), []).append(elem)
+    return index
 
-    The snippet is parsed as XML and then compared structurally against every
-    element of the same type in the body tree. Comparison ignores namespace
-    declarations and normalises whitespace.
+
+def find_snippet_in_tree(
+    body_root: etree._Element,
+    snippet: str,
+    index: SnippetIndex | None = None,
+) -> list[str]:
+    """Find all XPaths where *snippet* matches within a parsed body.
+
+    index: optional dict reused across calls on the same body_root. Each
+    snippet tag's elements are keyed once, so later snippets of that tag
+    are a dict lookup instead of a scan of the body.
 
     Returns a list of XPath strings. Empty list means no match, more than one
     means ambiguous.
     """
-    body_root = etree.fromstring(body_xml.encode("utf-8"), SECURE_PARSER)
-
     snippet_elem = parse_snippet(snippet)
     if snippet_elem is None:
         return []
 
-    snippet_tag = snippet_elem.tag
+    if index is None:
+        index = {}
+    by_key = index.get(snippet_elem.tag)
+    if by_key is None:
+        by_key = _index_by_structure(body_root, snippet_elem.tag)
+        index[snippet_elem.tag] = by_key
+
+    matched = by_key.get(_structural_key(snippet_elem), [])
+    return [build_xpath(elem, body_root) for elem in matched]
 
-    matches: list[str] = []
-    for elem in body_root.iter(snippet_tag):
-        if _elements_structurally_equal(elem, snippet_elem):
-            xpath = build_xpath(elem, body_root)
-            matches.append(xpath)
 
-    return matches
+def find_snippet_in_body(body_xml: str, snippet: str) -> list[str]:
+    """Find all XPaths where *snippet* matches within the document body.
+
+    The snippet is parsed as XML and then compared structurally against every
+    element of the same type in the body tree. Comparison ignores namespace
+    declarations and normalises whitespace.
+
+    Returns a list of XPath strings. Empty list means no match, more than one
+    means ambiguous.
+    """
+    body_root = etree.fromstring(body_xml.encode("utf-8"), SECURE_PARSER)
+    return find_snippet_in_tree(body_root, snippet)
@@ -14,8 +14,8 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-"""OOXML utilities — re-export barrel for snippet matching, formatting, and
-validation modules.
+"""OOXML utilities — re-export barrel for snippet matching, formatting, run
+building, and validation modules.
 
 This module re-exports all public symbols so that existing imports like
 `from src.xml_utils import ...` continue to work without changes.
@@ -24,15 +24,40 @@ This module re-exports all public symbols so that existing imports like
 from src.xml_snippet_matching import (  # noqa: F401
     NAMESPACES,
     SECURE_PARSER,
+    W_ASCII,
+    W_B,
+    W_BR,
+    W_COLOR,
+    W_CS,
+    W_EASTASIA,
+    W_HANSI,
+    W_I,
+    W_P,
+    W_PPR,
+    W_R,
+    W_RFONTS,
+    W_RPR,
+    W_SZ,
+    W_SZCS,
+    W_T,
+    W_TBL,
+    W_TC,
+    W_TCPR,
+    W_TR,
+    W_U,
+    W_VAL,
+    SnippetIndex,
     build_xpath,
     find_snippet_in_body,
+    find_snippet_in_tree,
     parse_snippet,
 )
 
 from src.xml_formatting import (  # noqa: F401
-    build_run_xml,
     extract_formatting,
     extract_formatting_from_element,
 )
 
+from src.xml_run_builder import build_run_element, build_run_xml  # noqa: F401
+
 from src.xml_validation import is_well_formed_ooxml  # noqa: F401
@@ -14,14 +14,20 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-"""Shared HTTP test infrastructure for MCP protocol and transport tests.
-
-Provides the mcp_session fixture (initialized TestClient + session headers),
-call_tool helper (builds JSON-RPC tools/call requests), and parse_tool_result
-helper (extracts tool results from SSE responses).
+"""Shared test infrastructure: fixture documents and the MCP HTTP harness.
+
+Provides the session-scoped table_docx, placeholder_docx and vendor_docx
+fixtures (the Word documents most test modules read), the session-scoped
+mcp_session fixture (initialized TestClient + session headers, shared by
+every HTTP test module), call_tool helper (builds JSON-RPC tools/call
+requests), parse_tool_result helper (extracts tool results from SSE
+responses), and compact_lines_by_id helper (maps element IDs to their
+compact_text lines).
 """
 
 import json
+import re
+from pathlib import Path
 
 import pytest
 from starlette.testclient import TestClient
@@ -32,6 +38,12 @@ from src.mcp_app import mcp
 import src.tools_extract  # noqa: F401 -- trigger tool registration
 import src.tools_write  # noqa: F401
 
+FIXTURES = Path(__file__).parent / "fixtures"
+INPUTS = Path(__file__).parent / "inputs"
+
+# Element line in compact_text: "T1-R2-C2: ..." (Word/Excel) or "[F1] ..." (PDF)
+_COMPACT_LINE_RE = re.compile(r"^(?:\[([^\]]+)\]|([A-Z][\w-]*):) .*$", re.M)
+
 INIT_BODY = {
     "jsonrpc": "2.0",
     "method": "initialize",
@@ -49,6 +61,35 @@ MCP_HEADERS = {
 }
 
 
+def pytest_configure(config):
+    """Import the tool modules' lazily-loaded dependencies once, up front.
+
+    tools_extract/tools_write (imported above) already pull in lxml,
+    openpyxl and PyMuPDF. pair_id_resolver and word_dry_run are imported
+    inside tool calls, so without this the first test to reach them pays
+    their import cost inside its own timing.
+    """
+    import src.handlers.word_dry_run  # noqa: F401
+    import src.pair_id_resolver  # noqa: F401
+
+
+# Session-scoped: the handlers only read their input bytes, and bytes are
+# immutable, so every module shares one read of each document per run.
+@pytest.fixture(scope="session")
+def table_docx() -> bytes:
+    return (FIXTURES / "table_questionnaire.docx").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def placeholder_docx() -> bytes:
+    return (FIXTURES / "placeholder_form.docx").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def vendor_docx() -> bytes:
+    return (INPUTS / "Vendor_Questionnaire.docx").read_bytes()
+
+
 def _fresh_app():
     """Build a Starlette app with a fresh session manager and 404 handler."""
     mcp._session_manager = None
@@ -64,12 +105,18 @@ def _reset_session_manager():
     mcp._session_manager = None
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mcp_session():
     """TestClient with lifespan, correct Host, and completed init handshake.
 
     Yields (client, session_headers) where session_headers includes
     Content-Type, Accept, and Mcp-Session-Id for subsequent requests.
+
+    Session-scoped: the initialize + initialized round-trips run once and
+    every HTTP test module shares the same MCP session. The app keeps its
+    own session manager, so _reset_session_manager and _fresh_app() in
+    other tests do not disturb it. The session is terminated with an
+    HTTP DELETE at the end of the test run.
     """
     app = _fresh_app()
     with TestClient(
@@ -92,6 +139,8 @@ def mcp_session():
         session_headers = {**MCP_HEADERS, "Mcp-Session-Id": session_id}
         yield client, session_headers
 
+        client.delete("/mcp", headers=session_headers)
+
 
 def call_tool(client, headers, tool_name, arguments, request_id=99):
     """Send a JSON-RPC tools/call request and return the raw response."""
@@ -133,3 +182,11 @@ def parse_tool_result(response) -> dict:
     raise ValueError(
         f"No tool result found in SSE response: {response.text[:500]}"
     )
+
+
+def compact_lines_by_id(compact_text: str) -> dict[str, str]:
+    """Map each element ID to its compact_text line in one regex pass."""
+    return {
+        m.group(1) or m.group(2): m.group(0)
+        for m in _COMPACT_LINE_RE.finditer(compact_text)
+    }
@@ -5,8 +5,6 @@ Layer 2: Suspicious-write warnings in validate_locations.
 Layer 3: dry_run preview in write_answers.
 """
 
-from pathlib import Path
-
 import pytest
 
 from src.handlers.word_indexer import extract_structure_compact
@@ -19,14 +17,6 @@ from src.models import (
     LocationStatus,
 )
 
-FIXTURES = Path(__file__).parent / "fixtures"
-
-
-@pytest.fixture
-def table_docx() -> bytes:
-    return (FIXTURES / "table_questionnaire.docx").read_bytes()
-
-
 # ── Layer 1: Role indicators ────────────────────────────────────────────────
 
 
@@ -184,6 +174,17 @@ class TestDryRunPreview:
         previews = preview_answers(table_docx, answers)
         assert previews[0]["status"] == "error"
 
+    def test_preview_malformed_xpath_is_rejected(self, table_docx: bytes) -> None:
+        """An XPath outside the positional-steps pattern is refused up front."""
+        answers = [AnswerPayload(
+            pair_id="q1",
+            xpath="./w:tbl[1]/w:tr[",
+            answer_text="Test",
+            mode=InsertionMode.REPLACE_CONTENT,
+        )]
+        with pytest.raises(ValueError, match="expected pattern"):
+            preview_answers(table_docx, answers)
+
     def test_preview_does_not_modify_document(self, table_docx: bytes) -> None:
         """preview_answers must not change the original file bytes."""
         original = table_docx
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import zipfile
 from io import BytesIO
 from pathlib import Path
@@ -29,13 +30,15 @@ from src.server import (
     verify_output,
     write_answers,
 )
+from src.handlers.word_parser import read_document_xml
 from src.tool_errors import build_answer_payloads
 from src.models import FileType
 
+from tests.conftest import compact_lines_by_id
+
 FIXTURES = Path(__file__).parent / "fixtures"
 W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 
-
 # ── Phase 3: Word Pipeline ──────────────────────────────────────────────────
 
 
@@ -79,9 +82,10 @@ class TestWordPipeline:
         """Write 5 answers inline, 5 via file, verify all 10, independent check."""
         compact = extract_structure_compact(file_path=docx_path)
         # Find empty answer target cells (row 2+ column 2)
+        lines = compact_lines_by_id(compact["compact_text"])
         targets = []
         for eid, xpath in compact["id_to_xpath"].items():
-            if "← answer target" in compact["compact_text"].split(eid + ":")[1].split("\n")[0]:
+            if "← answer target" in lines[eid]:
                 targets.append((eid, xpath))
             if len(targets) >= 10:
                 break
@@ -131,8 +135,7 @@ class TestWordPipeline:
         assert report["summary"]["structural_issues"] == 0
 
         # Independent check: open with python-docx raw XML
-        with zipfile.ZipFile(str(final_out)) as zf:
-            doc_xml = zf.read("word/document.xml").decode("utf-8")
+        doc_xml = read_document_xml(final_out.read_bytes()).decode("utf-8")
         for i in range(1, 6):
             assert f"Answer {i}" in doc_xml, f"Answer {i} not found in document XML"
 
@@ -199,12 +202,11 @@ class TestExcelPipeline:
         compact = extract_structure_compact(file_path=xlsx_path)
 
         # Find empty answer target cells
+        lines = compact_lines_by_id(compact["compact_text"])
         targets = []
         for eid in compact["id_to_xpath"]:
-            if "← answer target" in compact["compact_text"]:
-                line = [l for l in compact["compact_text"].split("\n") if eid in l]
-                if line and "← answer target" in line[0]:
-                    targets.append(eid)
+            if "← answer target" in lines.get(eid, ""):
+                targets.append(eid)
             if len(targets) >= 5:
                 break
 
@@ -293,21 +295,21 @@ class TestPdfPipeline:
         id_to_field = compact["id_to_xpath"]
 
         # Build answers for all fields
+        lines = compact_lines_by_id(compact["compact_text"])
         answers = []
         expected = []
         for fid, field_name in id_to_field.items():
             # Check field type from compact text
-            compact_line = [l for l in compact["compact_text"].split("\n") if fid in l]
-            if not compact_line:
+            compact_line = lines.get(fid)
+            if compact_line is None:
                 continue
 
-            if "checkbox" in compact_line[0].lower():
+            if "checkbox" in compact_line.lower():
                 value = "true"
                 expected_text = "true"
-            elif "dropdown" in compact_line[0].lower():
+            elif "dropdown" in compact_line.lower():
                 # Extract first option
-                import re
-                opts = re.search(r"options: (.+?)\)", compact_line[0])
+                opts = re.search(r"options: (.+?)\)", compact_line)
                 if opts:
                     value = opts.group(1).split(" | ")[0].strip()
                     expected_text = value
@@ -472,11 +474,14 @@ class TestAdversarialInputs:
         """Formula-like values must be written as text, not formulas."""
         compact = extract_structure_compact(file_path=xlsx_path)
         # Find an empty target cell
-        target = None
-        for line in compact["compact_text"].split("\n"):
-            if "← answer target" in line:
-                target = line.split(":")[0].strip()
-                break
+        target = next(
+            (
+                line.split(":")[0].strip()
+                for line in compact["compact_text"].splitlines()
+                if "← answer target" in line
+            ),
+            None,
+        )
         if not target:
             pytest.skip("No answer target in fixture")
 
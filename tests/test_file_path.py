@@ -64,12 +64,11 @@ class TestResolveFromPath:
 class TestResolveFromBase64:
     """Tests for the file_bytes_b64 code path (existing behavior)."""
 
-    def test_decodes_base64_with_explicit_type(self) -> None:
-        original = (FIXTURES / "table_questionnaire.docx").read_bytes()
-        b64 = base64.b64encode(original).decode()
+    def test_decodes_base64_with_explicit_type(self, table_docx: bytes) -> None:
+        b64 = base64.b64encode(table_docx).decode()
         raw, ft = resolve_file_input(b64, "word", None)
         assert ft == FileType.WORD
-        assert raw == original
+        assert raw == table_docx
 
     def test_missing_file_type_raises(self) -> None:
         b64 = base64.b64encode(b"PK fake").decode()
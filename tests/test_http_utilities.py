@@ -23,6 +23,8 @@ handles nonexistent files gracefully.
 
 import json
 
+import pytest
+
 from tests.conftest import call_tool, parse_tool_result
 from src.tools_extract import list_form_fields
 
@@ -31,48 +33,23 @@ EXCEL_FIXTURE = "tests/fixtures/vendor_assessment.xlsx"
 PDF_FIXTURE = "tests/fixtures/simple_form.pdf"
 
 
-def test_list_form_fields_word(mcp_session):
-    """list_form_fields over HTTP returns same result as direct call for Word."""
-    client, headers = mcp_session
-    args = {"file_path": WORD_FIXTURE}
-
-    resp = call_tool(client, headers, "list_form_fields", args)
-    assert resp.status_code == 200
-    http_result = parse_tool_result(resp)
-
-    direct = list_form_fields(file_path=WORD_FIXTURE)
-
-    assert http_result == direct
-    assert "fields" in http_result
-    assert len(http_result["fields"]) > 0
-
-
-def test_list_form_fields_excel(mcp_session):
-    """list_form_fields over HTTP returns same result as direct call for Excel."""
-    client, headers = mcp_session
-    args = {"file_path": EXCEL_FIXTURE}
-
-    resp = call_tool(client, headers, "list_form_fields", args)
-    assert resp.status_code == 200
-    http_result = parse_tool_result(resp)
-
-    direct = list_form_fields(file_path=EXCEL_FIXTURE)
-
-    assert http_result == direct
-    assert "fields" in http_result
-    assert len(http_result["fields"]) > 0
-
-
-def test_list_form_fields_pdf(mcp_session):
-    """list_form_fields over HTTP returns same result as direct call for PDF."""
+# One tools/call per file type: the MCP SDK validates each POST body as a
+# single JSON-RPC message, so JSON-RPC batch arrays are rejected with 400.
+@pytest.mark.parametrize(
+    "fixture_path",
+    [WORD_FIXTURE, EXCEL_FIXTURE, PDF_FIXTURE],
+    ids=["word", "excel", "pdf"],
+)
+def test_list_form_fields_matches_direct_call(mcp_session, fixture_path):
+    """list_form_fields over HTTP returns same result as direct call."""
     client, headers = mcp_session
-    args = {"file_path": PDF_FIXTURE}
+    args = {"file_path": fixture_path}
 
     resp = call_tool(client, headers, "list_form_fields", args)
     assert resp.status_code == 200
     http_result = parse_tool_result(resp)
 
-    direct = list_form_fields(file_path=PDF_FIXTURE)
+    direct = list_form_fields(file_path=fixture_path)
 
     assert http_result == direct
     assert "fields" in http_result
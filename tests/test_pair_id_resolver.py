@@ -31,15 +31,30 @@ from src.models import FileType
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
+# Fixture files are read once per session -- bytes are immutable and the
+# resolver only reads them, so every test can share the same object.
+
+
+@pytest.fixture(scope="session")
+def excel_bytes() -> bytes:
+    return (FIXTURES / "vendor_assessment.xlsx").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def pdf_bytes() -> bytes:
+    return (FIXTURES / "simple_form.pdf").read_bytes()
+
+
 # ── resolve_pair_ids: Word ────────────────────────────────────────────────────
 
 
-def test_resolve_word_pair_ids_returns_xpaths():
+def test_resolve_word_pair_ids_returns_xpaths(table_docx):
     """Known pair_ids from table_questionnaire.docx resolve to xpaths."""
     from src.pair_id_resolver import resolve_pair_ids
 
-    fb = (FIXTURES / "table_questionnaire.docx").read_bytes()
-    result = resolve_pair_ids(fb, FileType.WORD, ["T1-R2-C2", "T1-R3-C1"])
+    result = resolve_pair_ids(
+        table_docx, FileType.WORD, ["T1-R2-C2", "T1-R3-C1"]
+    )
 
     assert "T1-R2-C2" in result
     assert "T1-R3-C1" in result
@@ -48,12 +63,13 @@ def test_resolve_word_pair_ids_returns_xpaths():
     assert result["T1-R3-C1"] == "./w:tbl[1]/w:tr[3]/w:tc[1]"
 
 
-def test_resolve_word_unknown_pair_id_omitted():
+def test_resolve_word_unknown_pair_id_omitted(table_docx):
     """Unknown pair_ids are not in the returned dict."""
     from src.pair_id_resolver import resolve_pair_ids
 
-    fb = (FIXTURES / "table_questionnaire.docx").read_bytes()
-    result = resolve_pair_ids(fb, FileType.WORD, ["T99-R1-C1", "T1-R2-C2"])
+    result = resolve_pair_ids(
+        table_docx, FileType.WORD, ["T99-R1-C1", "T1-R2-C2"]
+    )
 
     assert "T99-R1-C1" not in result
     assert "T1-R2-C2" in result
@@ -62,12 +78,13 @@ def test_resolve_word_unknown_pair_id_omitted():
 # ── resolve_pair_ids: Excel ───────────────────────────────────────────────────
 
 
-def test_resolve_excel_pair_ids_returns_identity_xpaths():
+def test_resolve_excel_pair_ids_returns_identity_xpaths(excel_bytes):
     """Excel pair_ids resolve to themselves (identity mapping)."""
     from src.pair_id_resolver import resolve_pair_ids
 
-    fb = (FIXTURES / "vendor_assessment.xlsx").read_bytes()
-    result = resolve_pair_ids(fb, FileType.EXCEL, ["S1-R2-C2", "S1-R3-C1"])
+    result = resolve_pair_ids(
+        excel_bytes, FileType.EXCEL, ["S1-R2-C2", "S1-R3-C1"]
+    )
 
     assert result["S1-R2-C2"] == "S1-R2-C2"
     assert result["S1-R3-C1"] == "S1-R3-C1"
@@ -76,12 +93,11 @@ def test_resolve_excel_pair_ids_returns_identity_xpaths():
 # ── resolve_pair_ids: PDF ────────────────────────────────────────────────────
 
 
-def test_resolve_pdf_pair_ids_returns_field_names():
+def test_resolve_pdf_pair_ids_returns_field_names(pdf_bytes):
     """PDF pair_ids resolve to native field names."""
     from src.pair_id_resolver import resolve_pair_ids
 
-    fb = (FIXTURES / "simple_form.pdf").read_bytes()
-    result = resolve_pair_ids(fb, FileType.PDF, ["F1", "F2"])
+    result = resolve_pair_ids(pdf_bytes, FileType.PDF, ["F1", "F2"])
 
     assert result["F1"] == "full_name"
     assert result["F2"] == "email"
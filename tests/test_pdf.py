@@ -1,5 +1,6 @@
 """Tests for the PDF (.pdf) handler."""
 
+import re
 from pathlib import Path
 
 import pytest
@@ -14,94 +15,127 @@ from src.handlers.pdf_indexer import extract_structure_compact
 from src.handlers.pdf_verifier import verify_output
 from src.models import (
     AnswerPayload,
+    CompactStructureResponse,
     Confidence,
     ContentStatus,
     ExpectedAnswer,
+    ExtractStructureResponse,
+    FormField,
     InsertionMode,
     LocationSnippet,
     LocationStatus,
+    ValidatedLocation,
 )
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
+_QUOTED_RE = re.compile(r'"([^"]*)"')
 
-@pytest.fixture
+
+def _quoted_values(text: str) -> frozenset[str]:
+    """Every double-quoted value in a compact dump, collected in one pass."""
+    return frozenset(m.group(1) for m in _QUOTED_RE.finditer(text))
+
+
+# Session-scoped: the handlers only read their input bytes (PyMuPDF opens a
+# copy), so each fixture file is read from disk once per run.
+@pytest.fixture(scope="session")
 def simple_pdf() -> bytes:
     return (FIXTURES / "simple_form.pdf").read_bytes()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multi_page_pdf() -> bytes:
     return (FIXTURES / "multi_page_form.pdf").read_bytes()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def prefilled_pdf() -> bytes:
     return (FIXTURES / "prefilled_form.pdf").read_bytes()
 
 
+# Compact extraction is pure on the input bytes, so assertion-only tests
+# share one extraction per fixture instead of re-parsing the PDF each time.
+@pytest.fixture(scope="session")
+def compact_simple(simple_pdf: bytes) -> CompactStructureResponse:
+    return extract_structure_compact(simple_pdf)
+
+
+@pytest.fixture(scope="session")
+def compact_multi_page(multi_page_pdf: bytes) -> CompactStructureResponse:
+    return extract_structure_compact(multi_page_pdf)
+
+
+@pytest.fixture(scope="session")
+def compact_prefilled(prefilled_pdf: bytes) -> CompactStructureResponse:
+    return extract_structure_compact(prefilled_pdf)
+
+
+@pytest.fixture(scope="session")
+def simple_validation_all(simple_pdf: bytes) -> list[ValidatedLocation]:
+    """Validate every simple_form.pdf field ID (F1..F5 as q1..q5) once."""
+    locs = [
+        LocationSnippet(pair_id=f"q{i}", snippet=f"F{i}") for i in range(1, 6)
+    ]
+    return validate_locations(simple_pdf, locs)
+
+
 # ── extract_structure_compact ────────────────────────────────────────────────
 
 
+# Markers every simple_form.pdf compact dump must contain: header, field
+# IDs, native names, widget types, dropdown options, value states, context.
+_SIMPLE_COMPACT_MARKERS = [
+    "5 fields across 1 page",
+    "[F1]",
+    "[F5]",
+    '"full_name"',
+    '"email"',
+    '"department"',
+    "(text)",
+    "(checkbox)",
+    "(dropdown",
+    "options: HR | Engineering | Sales | Finance",
+    "— empty",
+    "— unchecked",
+    "Context:",
+]
+
+
 class TestExtractStructureCompact:
-    def test_header_shows_field_count(self, simple_pdf: bytes) -> None:
-        result = extract_structure_compact(simple_pdf)
-        assert "5 fields across 1 page" in result.compact_text
-
-    def test_contains_field_ids(self, simple_pdf: bytes) -> None:
-        result = extract_structure_compact(simple_pdf)
-        assert "[F1]" in result.compact_text
-        assert "[F5]" in result.compact_text
-
-    def test_contains_field_names(self, simple_pdf: bytes) -> None:
-        result = extract_structure_compact(simple_pdf)
-        assert '"full_name"' in result.compact_text
-        assert '"email"' in result.compact_text
-        assert '"department"' in result.compact_text
-
-    def test_shows_field_types(self, simple_pdf: bytes) -> None:
-        result = extract_structure_compact(simple_pdf)
-        assert "(text)" in result.compact_text
-        assert "(checkbox)" in result.compact_text
-        assert "(dropdown" in result.compact_text
-
-    def test_shows_dropdown_options(self, simple_pdf: bytes) -> None:
-        result = extract_structure_compact(simple_pdf)
-        assert "options: HR | Engineering | Sales | Finance" in result.compact_text
-
-    def test_empty_fields_marked_empty(self, simple_pdf: bytes) -> None:
-        result = extract_structure_compact(simple_pdf)
-        assert "— empty" in result.compact_text
-        assert "— unchecked" in result.compact_text
-
-    def test_prefilled_shows_values(self, prefilled_pdf: bytes) -> None:
-        result = extract_structure_compact(prefilled_pdf)
-        assert '"Jane Smith"' in result.compact_text
-        assert "— checked" in result.compact_text
-        assert '"Engineering"' in result.compact_text
-
-    def test_multi_page_shows_pages(self, multi_page_pdf: bytes) -> None:
-        result = extract_structure_compact(multi_page_pdf)
-        assert "8 fields across 3 pages" in result.compact_text
-        assert "Page 1:" in result.compact_text
-        assert "Page 2:" in result.compact_text
-        assert "Page 3:" in result.compact_text
+    @pytest.mark.parametrize("marker", _SIMPLE_COMPACT_MARKERS)
+    def test_simple_compact_text_contains(
+        self, compact_simple: CompactStructureResponse, marker: str
+    ) -> None:
+        assert marker in compact_simple.compact_text
 
-    def test_id_to_xpath_maps_to_native_names(
-        self, simple_pdf: bytes
+    def test_prefilled_shows_values(
+        self, compact_prefilled: CompactStructureResponse
     ) -> None:
-        result = extract_structure_compact(simple_pdf)
-        assert result.id_to_xpath["F1"] == "full_name"
-        assert result.id_to_xpath["F4"] == "agree_terms"
-        assert result.id_to_xpath["F5"] == "department"
+        assert {"Jane Smith", "Engineering"} <= _quoted_values(
+            compact_prefilled.compact_text
+        )
+        assert "— checked" in compact_prefilled.compact_text
 
-    def test_complex_elements_empty(self, simple_pdf: bytes) -> None:
-        result = extract_structure_compact(simple_pdf)
-        assert result.complex_elements == []
+    def test_multi_page_shows_pages(
+        self, compact_multi_page: CompactStructureResponse
+    ) -> None:
+        assert "8 fields across 3 pages" in compact_multi_page.compact_text
+        assert "Page 1:" in compact_multi_page.compact_text
+        assert "Page 2:" in compact_multi_page.compact_text
+        assert "Page 3:" in compact_multi_page.compact_text
 
-    def test_nearby_text_context(self, simple_pdf: bytes) -> None:
-        result = extract_structure_compact(simple_pdf)
-        assert "Context:" in result.compact_text
+    def test_id_to_xpath_maps_to_native_names(
+        self, compact_simple: CompactStructureResponse
+    ) -> None:
+        assert compact_simple.id_to_xpath["F1"] == "full_name"
+        assert compact_simple.id_to_xpath["F4"] == "agree_terms"
+        assert compact_simple.id_to_xpath["F5"] == "department"
+
+    def test_complex_elements_empty(
+        self, compact_simple: CompactStructureResponse
+    ) -> None:
+        assert compact_simple.complex_elements == []
 
 
 class TestExtractStructureCompactNonAcroForm:
@@ -122,25 +156,33 @@ class TestExtractStructureCompactNonAcroForm:
 
 
 class TestExtractStructure:
-    def test_returns_field_list(self, simple_pdf: bytes) -> None:
-        result = extract_structure(simple_pdf)
-        assert result.fields is not None
-        assert len(result.fields) == 5
-
-    def test_field_ids(self, simple_pdf: bytes) -> None:
-        result = extract_structure(simple_pdf)
-        ids = [f.field_id for f in result.fields]
+    @pytest.fixture(scope="class")
+    def structure_simple(self, simple_pdf: bytes) -> ExtractStructureResponse:
+        return extract_structure(simple_pdf)
+
+    def test_returns_field_list(
+        self, structure_simple: ExtractStructureResponse
+    ) -> None:
+        assert structure_simple.fields is not None
+        assert len(structure_simple.fields) == 5
+
+    def test_field_ids(
+        self, structure_simple: ExtractStructureResponse
+    ) -> None:
+        ids = [f.field_id for f in structure_simple.fields]
         assert ids == ["F1", "F2", "F3", "F4", "F5"]
 
-    def test_field_labels_are_native_names(self, simple_pdf: bytes) -> None:
-        result = extract_structure(simple_pdf)
-        labels = [f.label for f in result.fields]
+    def test_field_labels_are_native_names(
+        self, structure_simple: ExtractStructureResponse
+    ) -> None:
+        labels = [f.label for f in structure_simple.fields]
         assert "full_name" in labels
         assert "department" in labels
 
-    def test_field_types(self, simple_pdf: bytes) -> None:
-        result = extract_structure(simple_pdf)
-        types = {f.field_id: f.field_type for f in result.fields}
+    def test_field_types(
+        self, structure_simple: ExtractStructureResponse
+    ) -> None:
+        types = {f.field_id: f.field_type for f in structure_simple.fields}
         assert types["F1"] == "text"
         assert types["F4"] == "checkbox"
         assert types["F5"] == "dropdown"
@@ -150,30 +192,27 @@ class TestExtractStructure:
 
 
 class TestValidateLocations:
-    def test_valid_field_ids_matched(self, simple_pdf: bytes) -> None:
-        locs = [
-            LocationSnippet(pair_id="q1", snippet="F1"),
-            LocationSnippet(pair_id="q2", snippet="F5"),
-        ]
-        results = validate_locations(simple_pdf, locs)
-        assert all(r.status == LocationStatus.MATCHED for r in results)
+    def test_valid_field_ids_matched(
+        self, simple_validation_all: list[ValidatedLocation]
+    ) -> None:
+        assert all(
+            r.status == LocationStatus.MATCHED for r in simple_validation_all
+        )
 
     def test_invalid_field_id_not_found(self, simple_pdf: bytes) -> None:
         locs = [LocationSnippet(pair_id="bad", snippet="F99")]
         results = validate_locations(simple_pdf, locs)
         assert results[0].status == LocationStatus.NOT_FOUND
 
-    def test_matched_returns_context(self, simple_pdf: bytes) -> None:
-        locs = [LocationSnippet(pair_id="q1", snippet="F1")]
-        results = validate_locations(simple_pdf, locs)
-        assert results[0].context == "full_name (text)"
+    def test_matched_returns_context(
+        self, simple_validation_all: list[ValidatedLocation]
+    ) -> None:
+        assert simple_validation_all[0].context == "full_name (text)"
 
     def test_matched_returns_field_id_as_xpath(
-        self, simple_pdf: bytes
+        self, simple_validation_all: list[ValidatedLocation]
     ) -> None:
-        locs = [LocationSnippet(pair_id="q1", snippet="F1")]
-        results = validate_locations(simple_pdf, locs)
-        assert results[0].xpath == "F1"
+        assert simple_validation_all[0].xpath == "F1"
 
     def test_multi_page_field_ids(self, multi_page_pdf: bytes) -> None:
         locs = [
@@ -189,56 +228,33 @@ class TestValidateLocations:
 
 
 class TestWriteAnswers:
-    def test_write_text_field(self, simple_pdf: bytes) -> None:
-        answers = [
-            AnswerPayload(
-                pair_id="q1", xpath="F1",
-                insertion_xml="John Doe",
-                mode=InsertionMode.REPLACE_CONTENT,
-            ),
-        ]
-        filled = write_answers(simple_pdf, answers)
-        result = extract_structure_compact(filled)
-        assert '"John Doe"' in result.compact_text
-
-    def test_write_checkbox(self, simple_pdf: bytes) -> None:
-        answers = [
-            AnswerPayload(
-                pair_id="q1", xpath="F4",
-                insertion_xml="yes",
-                mode=InsertionMode.REPLACE_CONTENT,
-            ),
-        ]
-        filled = write_answers(simple_pdf, answers)
-        result = extract_structure_compact(filled)
-        assert "— checked" in result.compact_text
-
-    def test_write_dropdown(self, simple_pdf: bytes) -> None:
-        answers = [
-            AnswerPayload(
-                pair_id="q1", xpath="F5",
-                insertion_xml="Sales",
-                mode=InsertionMode.REPLACE_CONTENT,
-            ),
-        ]
-        filled = write_answers(simple_pdf, answers)
-        result = extract_structure_compact(filled)
-        assert '"Sales"' in result.compact_text
-
-    def test_write_multiple_fields(self, simple_pdf: bytes) -> None:
+    @pytest.fixture(scope="class")
+    def compact_filled_all(
+        self, simple_pdf: bytes
+    ) -> CompactStructureResponse:
+        """One write covering text, checkbox and dropdown fields at once."""
         answers = [
             AnswerPayload(pair_id="q1", xpath="F1",
-                          insertion_xml="Alice", mode=InsertionMode.REPLACE_CONTENT),
+                          insertion_xml="John Doe", mode=InsertionMode.REPLACE_CONTENT),
             AnswerPayload(pair_id="q2", xpath="F2",
                           insertion_xml="alice@test.com", mode=InsertionMode.REPLACE_CONTENT),
-            AnswerPayload(pair_id="q3", xpath="F5",
-                          insertion_xml="HR", mode=InsertionMode.REPLACE_CONTENT),
+            AnswerPayload(pair_id="q4", xpath="F4",
+                          insertion_xml="yes", mode=InsertionMode.REPLACE_CONTENT),
+            AnswerPayload(pair_id="q5", xpath="F5",
+                          insertion_xml="Sales", mode=InsertionMode.REPLACE_CONTENT),
         ]
         filled = write_answers(simple_pdf, answers)
-        result = extract_structure_compact(filled)
-        assert '"Alice"' in result.compact_text
-        assert '"alice@test.com"' in result.compact_text
-        assert '"HR"' in result.compact_text
+        return extract_structure_compact(filled)
+
+    @pytest.mark.parametrize(
+        "marker",
+        ['"John Doe"', '"alice@test.com"', "— checked", '"Sales"'],
+        ids=["text", "second_text", "checkbox", "dropdown"],
+    )
+    def test_written_value_appears(
+        self, compact_filled_all: CompactStructureResponse, marker: str
+    ) -> None:
+        assert marker in compact_filled_all.compact_text
 
     def test_unknown_field_id_skipped(self, simple_pdf: bytes) -> None:
         """Writing to a nonexistent field ID should not crash."""
@@ -256,44 +272,59 @@ class TestWriteAnswers:
         ]
         filled = write_answers(prefilled_pdf, answers)
         result = extract_structure_compact(filled)
-        assert '"Jane Smith"' in result.compact_text
-        assert '"1990-01-15"' in result.compact_text
+        assert {"Jane Smith", "1990-01-15"} <= _quoted_values(
+            result.compact_text
+        )
 
 
 # ── verify_output ────────────────────────────────────────────────────────────
 
 
 class TestVerifyOutput:
-    def test_all_matched(self, simple_pdf: bytes) -> None:
+    @pytest.fixture(scope="class")
+    def filled_for_verify(self, simple_pdf: bytes) -> bytes:
+        """One filled PDF shared by every expected-text comparison."""
         answers = [
             AnswerPayload(pair_id="q1", xpath="F1",
-                          insertion_xml="Test Name", mode=InsertionMode.REPLACE_CONTENT),
+                          insertion_xml="Net-Zero Target", mode=InsertionMode.REPLACE_CONTENT),
             AnswerPayload(pair_id="q2", xpath="F2",
                           insertion_xml="test@test.com", mode=InsertionMode.REPLACE_CONTENT),
         ]
-        filled = write_answers(simple_pdf, answers)
+        return write_answers(simple_pdf, answers)
 
+    def test_all_matched(self, filled_for_verify: bytes) -> None:
         expected = [
-            ExpectedAnswer(pair_id="q1", xpath="F1", expected_text="Test Name"),
+            ExpectedAnswer(pair_id="q1", xpath="F1", expected_text="Net-Zero Target"),
             ExpectedAnswer(pair_id="q2", xpath="F2", expected_text="test@test.com"),
         ]
-        report = verify_output(filled, expected)
+        report = verify_output(filled_for_verify, expected)
         assert report.summary.total == 2
         assert report.summary.matched == 2
         assert report.summary.mismatched == 0
 
-    def test_mismatched_text(self, simple_pdf: bytes) -> None:
-        answers = [
-            AnswerPayload(pair_id="q1", xpath="F1",
-                          insertion_xml="Actual", mode=InsertionMode.REPLACE_CONTENT),
-        ]
-        filled = write_answers(simple_pdf, answers)
-
+    @pytest.mark.parametrize(
+        "expected_text, want_matched, want_mismatched",
+        [
+            ("Net-Zero Target", 1, 0),
+            ("Wrong", 0, 1),
+            ("net-zero target", 1, 0),
+        ],
+        ids=["exact", "mismatched", "case_insensitive"],
+    )
+    def test_expected_text_comparison(
+        self,
+        filled_for_verify: bytes,
+        expected_text: str,
+        want_matched: int,
+        want_mismatched: int,
+    ) -> None:
         expected = [
-            ExpectedAnswer(pair_id="q1", xpath="F1", expected_text="Wrong"),
+            ExpectedAnswer(pair_id="q1", xpath="F1",
+                           expected_text=expected_text),
         ]
-        report = verify_output(filled, expected)
-        assert report.summary.mismatched == 1
+        report = verify_output(filled_for_verify, expected)
+        assert report.summary.matched == want_matched
+        assert report.summary.mismatched == want_mismatched
 
     def test_missing_field_id(self, simple_pdf: bytes) -> None:
         expected = [
@@ -302,21 +333,6 @@ class TestVerifyOutput:
         report = verify_output(simple_pdf, expected)
         assert report.summary.missing == 1
 
-    def test_case_insensitive_match(self, simple_pdf: bytes) -> None:
-        answers = [
-            AnswerPayload(pair_id="q1", xpath="F1",
-                          insertion_xml="Net-Zero Target", mode=InsertionMode.REPLACE_CONTENT),
-        ]
-        filled = write_answers(simple_pdf, answers)
-
-        expected = [
-            ExpectedAnswer(pair_id="q1", xpath="F1",
-                           expected_text="net-zero target"),
-        ]
-        report = verify_output(filled, expected)
-        assert report.summary.matched == 1
-        assert report.summary.mismatched == 0
-
     def test_no_structural_issues(self, simple_pdf: bytes) -> None:
         report = verify_output(simple_pdf, [])
         assert report.structural_issues == []
@@ -342,18 +358,21 @@ class TestVerifyOutput:
 
 
 class TestListFormFields:
-    def test_returns_all_fields(self, simple_pdf: bytes) -> None:
-        fields = list_form_fields(simple_pdf)
-        assert len(fields) == 5
+    @pytest.fixture(scope="class")
+    def fields_simple(self, simple_pdf: bytes) -> list[FormField]:
+        return list_form_fields(simple_pdf)
 
-    def test_field_ids_sequential(self, simple_pdf: bytes) -> None:
-        fields = list_form_fields(simple_pdf)
-        ids = [f.field_id for f in fields]
+    def test_returns_all_fields(self, fields_simple: list[FormField]) -> None:
+        assert len(fields_simple) == 5
+
+    def test_field_ids_sequential(
+        self, fields_simple: list[FormField]
+    ) -> None:
+        ids = [f.field_id for f in fields_simple]
         assert ids == ["F1", "F2", "F3", "F4", "F5"]
 
-    def test_field_types(self, simple_pdf: bytes) -> None:
-        fields = list_form_fields(simple_pdf)
-        type_map = {f.field_id: f.field_type for f in fields}
+    def test_field_types(self, fields_simple: list[FormField]) -> None:
+        type_map = {f.field_id: f.field_type for f in fields_simple}
         assert type_map["F1"] == "text"
         assert type_map["F4"] == "checkbox"
         assert type_map["F5"] == "dropdown"
@@ -370,20 +389,22 @@ class TestListFormFields:
 
 
 class TestFullPipeline:
-    def test_extract_validate_write_verify(self, simple_pdf: bytes) -> None:
+    def test_extract_validate_write_verify(
+        self,
+        simple_pdf: bytes,
+        simple_validation_all: list[ValidatedLocation],
+    ) -> None:
         """End-to-end: extract → validate → write → verify."""
         # Step 1: Extract
         compact = extract_structure_compact(simple_pdf)
         assert "[F1]" in compact.compact_text
 
-        # Step 2: Validate
+        # Step 2: Validate (all five field IDs, shared with the class above)
         field_ids = ["F1", "F2", "F3", "F4", "F5"]
-        locs = [
-            LocationSnippet(pair_id=f"q{i}", snippet=fid)
-            for i, fid in enumerate(field_ids, 1)
-        ]
-        validated = validate_locations(simple_pdf, locs)
-        assert all(v.status == LocationStatus.MATCHED for v in validated)
+        assert [v.xpath for v in simple_validation_all] == field_ids
+        assert all(
+            v.status == LocationStatus.MATCHED for v in simple_validation_all
+        )
 
         # Step 3: Write
         values = [
@@ -8,38 +8,94 @@ and backward compatibility.
 
 from __future__ import annotations
 
+import base64
+import io
 import zipfile
 from pathlib import Path
 
 import openpyxl
 import pytest
 
+from src.handlers.word_parser import read_document_xml
 from src.server import (
     extract_structure_compact,
     verify_output,
     write_answers,
 )
 
+from tests.conftest import compact_lines_by_id
+
 FIXTURES = Path(__file__).parent / "fixtures"
 W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 
+_MINIMAL_CONTENT_TYPES = (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'content-types">'
+    '<Default Extension="rels" ContentType="application/'
+    'vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    "</Types>"
+)
+_MINIMAL_RELS = (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    "</Relationships>"
+)
+
+
+@pytest.fixture(scope="session")
+def docx_path() -> str:
+    return str(FIXTURES / "table_questionnaire.docx")
+
+
+@pytest.fixture(scope="session")
+def xlsx_path() -> str:
+    return str(FIXTURES / "vendor_assessment.xlsx")
 
-class TestPairIdOnlyWrite:
-    """Tests for pair_id-only write_answers (no xpath, no mode)."""
 
-    @pytest.fixture
-    def docx_path(self) -> str:
-        return str(FIXTURES / "table_questionnaire.docx")
+@pytest.fixture(scope="session")
+def compact_docx(docx_path: str) -> dict:
+    """Compact extraction of the unfilled questionnaire, shared read-only."""
+    return extract_structure_compact(file_path=docx_path)
 
-    @pytest.fixture
-    def xlsx_path(self) -> str:
-        return str(FIXTURES / "vendor_assessment.xlsx")
+
+@pytest.fixture(scope="session")
+def minimal_docx_b64() -> str:
+    """Smallest valid DOCX (one empty paragraph, no tables), base64-encoded.
+
+    Enough to reach the pair_id-not-resolved error paths without loading
+    the full questionnaire fixture.
+    """
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("[Content_Types].xml", _MINIMAL_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _MINIMAL_RELS)
+        zf.writestr(
+            "word/document.xml",
+            f'<w:document xmlns:w="{W}"><w:body><w:p/></w:body></w:document>',
+        )
+    return base64.b64encode(buf.getvalue()).decode()
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One output directory for the run; each test uses a unique filename."""
+    return tmp_path_factory.mktemp("resolution")
+
+
+class TestPairIdOnlyWrite:
+    """Tests for pair_id-only write_answers (no xpath, no mode)."""
 
     def test_write_answers_pair_id_only_word(
-        self, docx_path: str, tmp_path: Path
+        self, docx_path: str, shared_tmp: Path
     ) -> None:
         """Call write_answers with only pair_id and answer_text for Word."""
-        out = tmp_path / "pair_id_only.docx"
+        out = shared_tmp / "pair_id_only.docx"
         result = write_answers(
             answers=[
                 {"pair_id": "T1-R2-C2", "answer_text": "Acme Corp"},
@@ -49,22 +105,16 @@ class TestPairIdOnlyWrite:
         )
         assert out.exists()
 
-        # Verify the answer was written by re-extracting
-        compact = extract_structure_compact(file_path=str(out))
-        # Find the line for T1-R2-C2
-        for line in compact["compact_text"].split("\n"):
-            if line.startswith("T1-R2-C2:"):
-                assert "Acme Corp" in line
-                break
-        else:
-            pytest.fail("T1-R2-C2 not found in compact output")
+        # Verify the answer was written (placement is covered by the
+        # cross-check test, which re-extracts and reads the T1-R2-C2 line)
+        assert "Acme Corp" in read_document_xml(out.read_bytes()).decode("utf-8")
 
     def test_write_answers_pair_id_only_defaults_mode(
-        self, docx_path: str, tmp_path: Path
+        self, docx_path: str, shared_tmp: Path
     ) -> None:
         """Mode defaults to replace_content (existing content is replaced)."""
         # First write something to the cell
-        step1 = tmp_path / "step1.docx"
+        step1 = shared_tmp / "step1.docx"
         write_answers(
             answers=[
                 {"pair_id": "T1-R2-C2", "answer_text": "Original Text"},
@@ -74,7 +124,7 @@ class TestPairIdOnlyWrite:
         )
 
         # Now overwrite with pair_id-only (should replace, not append)
-        step2 = tmp_path / "step2.docx"
+        step2 = shared_tmp / "step2.docx"
         write_answers(
             answers=[
                 {"pair_id": "T1-R2-C2", "answer_text": "Replacement"},
@@ -84,22 +134,17 @@ class TestPairIdOnlyWrite:
         )
 
         # Verify replacement happened (Original Text should be gone)
-        with zipfile.ZipFile(str(step2)) as zf:
-            doc_xml = zf.read("word/document.xml").decode("utf-8")
-        assert "Replacement" in doc_xml
-        assert "Original Text" not in doc_xml
+        compact = extract_structure_compact(file_path=str(step2))
+        assert "Replacement" in compact["compact_text"]
+        assert "Original Text" not in compact["compact_text"]
 
     def test_write_answers_cross_check_warning(
-        self, docx_path: str, tmp_path: Path
+        self, docx_path: str, shared_tmp: Path
     ) -> None:
         """Cross-check warns when agent xpath differs from resolved xpath."""
-        # Get the real xpath for T1-R2-C2
-        compact = extract_structure_compact(file_path=docx_path)
-        real_xpath = compact["id_to_xpath"]["T1-R2-C2"]
-
         # Send a deliberately wrong xpath with the correct pair_id
         wrong_xpath = "./w:tbl[99]/w:tr[99]/w:tc[99]"
-        out = tmp_path / "cross_check.docx"
+        out = shared_tmp / "cross_check.docx"
         result = write_answers(
             answers=[{
                 "pair_id": "T1-R2-C2",
@@ -119,15 +164,12 @@ class TestPairIdOnlyWrite:
         # Verify the answer was written at the CORRECT location
         # (resolved from pair_id, not the wrong xpath)
         compact_out = extract_structure_compact(file_path=str(out))
-        for line in compact_out["compact_text"].split("\n"):
-            if line.startswith("T1-R2-C2:"):
-                assert "Cross Check Corp" in line
-                break
-        else:
-            pytest.fail("Answer not found at correct location")
+        line = compact_lines_by_id(compact_out["compact_text"]).get("T1-R2-C2")
+        assert line is not None, "Answer not found at correct location"
+        assert "Cross Check Corp" in line
 
     def test_write_answers_pair_id_not_found(
-        self, docx_path: str, tmp_path: Path
+        self, minimal_docx_b64: str
     ) -> None:
         """Unresolvable pair_id raises ValueError with clear message."""
         with pytest.raises(ValueError, match="could not be resolved"):
@@ -136,7 +178,8 @@ class TestPairIdOnlyWrite:
                     "pair_id": "T99-R99-C99",
                     "answer_text": "Ghost Corp",
                 }],
-                file_path=docx_path,
+                file_bytes_b64=minimal_docx_b64,
+                file_type="word",
             )
 
     def test_write_answers_insertion_xml_still_requires_xpath(
@@ -152,22 +195,20 @@ class TestPairIdOnlyWrite:
                 file_path=docx_path,
             )
 
-    def test_write_answers_pair_id_only_excel(
-        self, xlsx_path: str, tmp_path: Path
-    ) -> None:
+    def test_write_answers_pair_id_only_excel(self, xlsx_path: str) -> None:
         """Call write_answers with only pair_id and answer_text for Excel."""
-        out = tmp_path / "pair_id_only.xlsx"
         result = write_answers(
             answers=[
                 {"pair_id": "S1-R2-C2", "answer_text": "Excel Corp"},
             ],
             file_path=xlsx_path,
-            output_file_path=str(out),
         )
-        assert out.exists()
+        filled = base64.b64decode(result["file_bytes_b64"])
 
-        # Verify the answer with openpyxl
-        wb = openpyxl.load_workbook(str(out))
+        # Verify the answer with openpyxl (values only, no styles)
+        wb = openpyxl.load_workbook(
+            io.BytesIO(filled), read_only=True, data_only=True
+        )
         ws = wb.worksheets[0]
         # S1-R2-C2 = sheet 1, row 2, col 2
         cell_value = ws.cell(row=2, column=2).value
@@ -178,45 +219,34 @@ class TestPairIdOnlyWrite:
 class TestPairIdOnlyVerify:
     """Tests for pair_id-only verify_output (no xpath required)."""
 
-    @pytest.fixture
-    def docx_path(self) -> str:
-        return str(FIXTURES / "table_questionnaire.docx")
-
-    @pytest.fixture
-    def xlsx_path(self) -> str:
-        return str(FIXTURES / "vendor_assessment.xlsx")
-
-    @pytest.fixture
-    def filled_docx_path(self, docx_path: str, tmp_path: Path) -> str:
-        """Write an answer to a Word doc and return the filled file path."""
-        out = tmp_path / "filled.docx"
-        write_answers(
+    @pytest.fixture(scope="class")
+    def filled_docx_b64(self, docx_path: str) -> str:
+        """Write an answer to a Word doc and return the filled bytes (b64)."""
+        result = write_answers(
             answers=[{"pair_id": "T1-R2-C2", "answer_text": "Acme Corp"}],
             file_path=docx_path,
-            output_file_path=str(out),
         )
-        return str(out)
+        return result["file_bytes_b64"]
 
-    @pytest.fixture
-    def filled_xlsx_path(self, xlsx_path: str, tmp_path: Path) -> str:
-        """Write an answer to an Excel doc and return the filled file path."""
-        out = tmp_path / "filled.xlsx"
-        write_answers(
+    @pytest.fixture(scope="class")
+    def filled_xlsx_b64(self, xlsx_path: str) -> str:
+        """Write an answer to an Excel doc and return the filled bytes (b64)."""
+        result = write_answers(
             answers=[{"pair_id": "S1-R2-C2", "answer_text": "Excel Corp"}],
             file_path=xlsx_path,
-            output_file_path=str(out),
         )
-        return str(out)
+        return result["file_bytes_b64"]
 
     def test_verify_output_pair_id_only_word(
-        self, filled_docx_path: str
+        self, filled_docx_b64: str
     ) -> None:
         """Verify with pair_id-only (no xpath) on a filled Word doc."""
         result = verify_output(
             expected_answers=[
                 {"pair_id": "T1-R2-C2", "expected_text": "Acme Corp"},
             ],
-            file_path=filled_docx_path,
+            file_bytes_b64=filled_docx_b64,
+            file_type="word",
         )
         assert result["summary"]["matched"] == 1
         assert result["summary"]["mismatched"] == 0
@@ -226,14 +256,15 @@ class TestPairIdOnlyVerify:
         assert cr["resolved_from"] == "pair_id"
 
     def test_verify_output_pair_id_only_excel(
-        self, filled_xlsx_path: str
+        self, filled_xlsx_b64: str
     ) -> None:
         """Verify with pair_id-only (no xpath) on a filled Excel doc."""
         result = verify_output(
             expected_answers=[
                 {"pair_id": "S1-R2-C2", "expected_text": "Excel Corp"},
             ],
-            file_path=filled_xlsx_path,
+            file_bytes_b64=filled_xlsx_b64,
+            file_type="excel",
         )
         assert result["summary"]["matched"] == 1
         assert result["summary"]["mismatched"] == 0
@@ -243,13 +274,9 @@ class TestPairIdOnlyVerify:
         assert cr["resolved_from"] == "pair_id"
 
     def test_verify_output_cross_check_warning(
-        self, filled_docx_path: str
+        self, filled_docx_b64: str
     ) -> None:
         """Cross-check warns when xpath disagrees with pair_id resolution."""
-        # Get the real xpath for T1-R2-C2
-        compact = extract_structure_compact(file_path=filled_docx_path)
-        real_xpath = compact["id_to_xpath"]["T1-R2-C2"]
-
         # Send a wrong xpath with the correct pair_id
         wrong_xpath = "./w:tbl[99]/w:tr[99]/w:tc[99]"
         result = verify_output(
@@ -258,7 +285,8 @@ class TestPairIdOnlyVerify:
                 "xpath": wrong_xpath,
                 "expected_text": "Acme Corp",
             }],
-            file_path=filled_docx_path,
+            file_bytes_b64=filled_docx_b64,
+            file_type="word",
         )
 
         # Warnings should be present
@@ -274,11 +302,11 @@ class TestPairIdOnlyVerify:
         assert cr["resolved_from"] == "pair_id"
 
     def test_verify_output_backward_compatible(
-        self, filled_docx_path: str
+        self, filled_docx_b64: str, compact_docx: dict
     ) -> None:
         """Verify with explicit xpath (old way) still works."""
-        compact = extract_structure_compact(file_path=filled_docx_path)
-        real_xpath = compact["id_to_xpath"]["T1-R2-C2"]
+        # Filling a cell does not move it, so the source xpath still applies
+        real_xpath = compact_docx["id_to_xpath"]["T1-R2-C2"]
 
         result = verify_output(
             expected_answers=[{
@@ -286,7 +314,8 @@ class TestPairIdOnlyVerify:
                 "xpath": real_xpath,
                 "expected_text": "Acme Corp",
             }],
-            file_path=filled_docx_path,
+            file_bytes_b64=filled_docx_b64,
+            file_type="word",
         )
 
         assert result["summary"]["matched"] == 1
@@ -295,7 +324,7 @@ class TestPairIdOnlyVerify:
         assert cr["resolved_from"] == "xpath"
 
     def test_verify_output_pair_id_not_found(
-        self, filled_docx_path: str
+        self, minimal_docx_b64: str
     ) -> None:
         """Non-existent pair_id raises ValueError with clear message."""
         with pytest.raises(ValueError, match="could not be resolved"):
@@ -304,5 +333,6 @@ class TestPairIdOnlyVerify:
                     "pair_id": "T99-R99-C99",
                     "expected_text": "Ghost Corp",
                 }],
-                file_path=filled_docx_path,
+                file_bytes_b64=minimal_docx_b64,
+                file_type="word",
             )
@@ -1,6 +1,7 @@
 """Tests for the Word (.docx) handler."""
 
-from pathlib import Path
+import zipfile
+from io import BytesIO
 
 import pytest
 from lxml import etree
@@ -12,51 +13,81 @@ from src.handlers.word import (
     validate_locations,
     write_answers,
 )
+from src.handlers.word_parser import get_body_element, read_document_xml
 from src.models import (
     AnswerPayload,
     AnswerType,
     BuildInsertionXmlRequest,
+    ExtractStructureResponse,
+    FormField,
     InsertionMode,
     LocationSnippet,
     LocationStatus,
 )
-from src.xml_utils import NAMESPACES
+from src.xml_utils import NAMESPACES, SECURE_PARSER
 
-FIXTURES = Path(__file__).parent / "fixtures"
 W = NAMESPACES["w"]
 
+# XPaths the tests evaluate repeatedly, compiled once at import.
+_FIND_TBL = etree.XPath(".//w:tbl", namespaces=NAMESPACES)
+_FIND_ROWS = etree.XPath("w:tr", namespaces=NAMESPACES)
+_ANSWER_CELL = etree.XPath(
+    "./w:tbl[1]/w:tr[$r]/w:tc[2]/w:p[1]", namespaces=NAMESPACES
+)
+_FIND_PARA_WITH_TEXT = etree.XPath(
+    ".//w:p[.//w:t[contains(text(), $marker)]]", namespaces=NAMESPACES
+)
+
+
+def _question_snippet(body_root: etree._Element, row_idx: int) -> str:
+    """Serialize the question paragraph (first cell) of table 1, row row_idx."""
+    rows = _FIND_ROWS(_FIND_TBL(body_root)[0])
+    q_cell = rows[row_idx].findall("w:tc", NAMESPACES)[0]
+    return etree.tostring(q_cell.find("w:p", NAMESPACES), encoding="unicode")
 
-@pytest.fixture
-def table_docx() -> bytes:
-    return (FIXTURES / "table_questionnaire.docx").read_bytes()
 
+# Session-scoped like the conftest documents they derive from: tests must
+# treat table_structure / table_body_root as read-only and write through
+# write_answers instead.
+@pytest.fixture(scope="session")
+def table_structure(table_docx: bytes) -> ExtractStructureResponse:
+    return extract_structure(table_docx)
 
-@pytest.fixture
-def placeholder_docx() -> bytes:
-    return (FIXTURES / "placeholder_form.docx").read_bytes()
+
+@pytest.fixture(scope="session")
+def table_body_root(table_docx: bytes) -> etree._Element:
+    """Parsed w:body of the questionnaire (shared, read-only)."""
+    return get_body_element(table_docx)
 
 
 # ── extract_structure ────────────────────────────────────────────────────────
 
 
 class TestExtractStructure:
-    def test_returns_body_xml(self, table_docx: bytes) -> None:
-        result = extract_structure(table_docx)
-        assert result.body_xml is not None
-        assert "<w:body" in result.body_xml
+    def test_returns_body_xml(
+        self, table_structure: ExtractStructureResponse
+    ) -> None:
+        assert table_structure.body_xml is not None
+        assert "<w:body" in table_structure.body_xml
 
-    def test_body_xml_is_parseable(self, table_docx: bytes) -> None:
-        result = extract_structure(table_docx)
-        root = etree.fromstring(result.body_xml.encode("utf-8"))
+    def test_body_xml_is_parseable(
+        self, table_structure: ExtractStructureResponse
+    ) -> None:
+        root = etree.fromstring(
+            table_structure.body_xml.encode("utf-8"), SECURE_PARSER
+        )
         assert root.tag == f"{{{W}}}body"
 
-    def test_contains_table_elements(self, table_docx: bytes) -> None:
-        result = extract_structure(table_docx)
-        assert "<w:tbl" in result.body_xml or f"{{{W}}}tbl" in result.body_xml
+    def test_contains_table_elements(
+        self, table_structure: ExtractStructureResponse
+    ) -> None:
+        body_xml = table_structure.body_xml
+        assert "<w:tbl" in body_xml or f"{{{W}}}tbl" in body_xml
 
-    def test_contains_question_text(self, table_docx: bytes) -> None:
-        result = extract_structure(table_docx)
-        assert "full legal name" in result.body_xml
+    def test_contains_question_text(
+        self, table_structure: ExtractStructureResponse
+    ) -> None:
+        assert "full legal name" in table_structure.body_xml
 
     def test_placeholder_form(self, placeholder_docx: bytes) -> None:
         result = extract_structure(placeholder_docx)
@@ -72,21 +103,12 @@ class TestExtractStructure:
 
 
 class TestValidateLocations:
-    def test_matches_existing_paragraph(self, table_docx: bytes) -> None:
+    def test_matches_existing_paragraph(
+        self, table_docx: bytes, table_body_root: etree._Element
+    ) -> None:
         """Extract a snippet from the actual document and validate it matches."""
-        result = extract_structure(table_docx)
-        body = etree.fromstring(result.body_xml.encode("utf-8"))
-
-        # Find a specific table cell paragraph and use it as a snippet
-        # Get the first table row's first cell paragraph
-        first_tbl = body.find(".//w:tbl", NAMESPACES)
-        assert first_tbl is not None
-        # Get second row (first question row), second cell (answer cell)
-        rows = first_tbl.findall("w:tr", NAMESPACES)
-        assert len(rows) >= 2
-        q_cell = rows[1].findall("w:tc", NAMESPACES)[0]
-        q_para = q_cell.find("w:p", NAMESPACES)
-        snippet_xml = etree.tostring(q_para, encoding="unicode")
+        # Use the first question row's question paragraph as a snippet
+        snippet_xml = _question_snippet(table_body_root, 1)
 
         locations = [LocationSnippet(pair_id="q1", snippet=snippet_xml)]
         validated = validate_locations(table_docx, locations)
@@ -107,20 +129,16 @@ class TestValidateLocations:
         assert len(validated) == 1
         assert validated[0].status == LocationStatus.NOT_FOUND
 
-    def test_multiple_locations(self, table_docx: bytes) -> None:
+    def test_multiple_locations(
+        self, table_docx: bytes, table_body_root: etree._Element
+    ) -> None:
         """Validate multiple locations in one call."""
-        result = extract_structure(table_docx)
-        body = etree.fromstring(result.body_xml.encode("utf-8"))
-
-        first_tbl = body.find(".//w:tbl", NAMESPACES)
-        rows = first_tbl.findall("w:tr", NAMESPACES)
-
-        snippets = []
-        for i, row in enumerate(rows[1:3], start=1):  # rows 1 and 2
-            q_cell = row.findall("w:tc", NAMESPACES)[0]
-            q_para = q_cell.find("w:p", NAMESPACES)
-            snippet_xml = etree.tostring(q_para, encoding="unicode")
-            snippets.append(LocationSnippet(pair_id=f"q{i}", snippet=snippet_xml))
+        snippets = [
+            LocationSnippet(
+                pair_id=f"q{i}", snippet=_question_snippet(table_body_root, i)
+            )
+            for i in (1, 2)
+        ]
 
         validated = validate_locations(table_docx, snippets)
         assert len(validated) == 2
@@ -131,32 +149,32 @@ class TestValidateLocations:
         validated = validate_locations(table_docx, locations)
         assert validated[0].status == LocationStatus.NOT_FOUND
 
-    def test_element_id_table_cell_matched(self, table_docx: bytes) -> None:
-        """Element IDs like T1-R1-C1 should resolve via the indexer mapping."""
-        locations = [LocationSnippet(pair_id="q1", snippet="T1-R1-C1")]
-        validated = validate_locations(table_docx, locations)
-
-        assert len(validated) == 1
-        assert validated[0].status == LocationStatus.MATCHED
-        assert validated[0].xpath is not None
-        assert "w:tbl[1]" in validated[0].xpath
-
-    def test_element_id_paragraph_matched(self, table_docx: bytes) -> None:
-        """Paragraph IDs like P1 should resolve via the indexer mapping."""
-        locations = [LocationSnippet(pair_id="p1", snippet="P1")]
-        validated = validate_locations(table_docx, locations)
-
-        assert len(validated) == 1
-        assert validated[0].status == LocationStatus.MATCHED
-        assert validated[0].xpath is not None
-
-    def test_element_id_not_found(self, table_docx: bytes) -> None:
-        """A non-existent element ID should return NOT_FOUND."""
-        locations = [LocationSnippet(pair_id="bad", snippet="T99-R99-C99")]
+    @pytest.mark.parametrize(
+        "pair_id, snippet, expected_status, xpath_fragment",
+        [
+            ("q1", "T1-R1-C1", LocationStatus.MATCHED, "w:tbl[1]"),
+            ("p1", "P1", LocationStatus.MATCHED, "w:p[1]"),
+            ("bad", "T99-R99-C99", LocationStatus.NOT_FOUND, None),
+        ],
+        ids=["table_cell", "paragraph", "not_found"],
+    )
+    def test_element_id_resolution(
+        self,
+        table_docx: bytes,
+        pair_id: str,
+        snippet: str,
+        expected_status: LocationStatus,
+        xpath_fragment: str | None,
+    ) -> None:
+        """Element IDs (T1-R1-C1, P1) resolve via the indexer mapping."""
+        locations = [LocationSnippet(pair_id=pair_id, snippet=snippet)]
         validated = validate_locations(table_docx, locations)
 
         assert len(validated) == 1
-        assert validated[0].status == LocationStatus.NOT_FOUND
+        assert validated[0].status == expected_status
+        if xpath_fragment is not None:
+            assert validated[0].xpath is not None
+            assert xpath_fragment in validated[0].xpath
 
     def test_element_id_multiple(self, table_docx: bytes) -> None:
         """Multiple element IDs validated in one call."""
@@ -181,15 +199,11 @@ class TestValidateLocations:
         assert validated[0].context is not None
         assert len(validated[0].context) > 0
 
-    def test_mixed_element_ids_and_snippets(self, table_docx: bytes) -> None:
+    def test_mixed_element_ids_and_snippets(
+        self, table_docx: bytes, table_body_root: etree._Element
+    ) -> None:
         """A call mixing element IDs and OOXML snippets should handle both."""
-        result = extract_structure(table_docx)
-        body = etree.fromstring(result.body_xml.encode("utf-8"))
-        first_tbl = body.find(".//w:tbl", NAMESPACES)
-        rows = first_tbl.findall("w:tr", NAMESPACES)
-        q_cell = rows[1].findall("w:tc", NAMESPACES)[0]
-        q_para = q_cell.find("w:p", NAMESPACES)
-        snippet_xml = etree.tostring(q_para, encoding="unicode")
+        snippet_xml = _question_snippet(table_body_root, 1)
 
         locations = [
             LocationSnippet(pair_id="by_id", snippet="T1-R1-C1"),
@@ -223,7 +237,9 @@ class TestBuildInsertionXml:
         assert resp.valid is True
         assert resp.insertion_xml
         # Parse and verify formatting inheritance
-        elem = etree.fromstring(resp.insertion_xml.encode("utf-8"))
+        elem = etree.fromstring(
+            resp.insertion_xml.encode("utf-8"), SECURE_PARSER
+        )
         rpr = elem.find(f"{{{W}}}rPr")
         assert rpr is not None
         rfonts = rpr.find(f"{{{W}}}rFonts")
@@ -241,7 +257,9 @@ class TestBuildInsertionXml:
         )
         resp = build_insertion_xml(req)
         assert resp.valid is True
-        elem = etree.fromstring(resp.insertion_xml.encode("utf-8"))
+        elem = etree.fromstring(
+            resp.insertion_xml.encode("utf-8"), SECURE_PARSER
+        )
         assert elem.find(f"{{{W}}}rPr") is None
 
     def test_structured_valid_xml(self) -> None:
@@ -279,23 +297,27 @@ class TestBuildInsertionXml:
 
 
 class TestWriteAnswers:
-    def _get_answer_cell_xpath(self, file_bytes: bytes, row_index: int) -> str:
+    def _get_answer_cell_xpath(
+        self, body_root: etree._Element, row_index: int
+    ) -> str:
         """Helper: build XPath to the answer paragraph in a table row.
 
         Empty answer cells are structurally identical so snippet matching
-        returns AMBIGUOUS. Instead we build the XPath directly.
+        returns AMBIGUOUS. Instead we build the XPath directly and check it
+        against the already-parsed body.
         """
-        result = extract_structure(file_bytes)
-        body = etree.fromstring(result.body_xml.encode("utf-8"))
         # Build the XPath for: first table → row N → cell 2 → paragraph 1
         xpath = f"./w:tbl[1]/w:tr[{row_index + 1}]/w:tc[2]/w:p[1]"
-        matched = body.xpath(xpath, namespaces=NAMESPACES)
+        matched = _ANSWER_CELL(body_root, r=row_index + 1)
         assert matched, f"XPath {xpath} did not match"
         return xpath
 
-    def test_replace_content(self, table_docx: bytes) -> None:
-        xpath = self._get_answer_cell_xpath(table_docx, 1)
-
+    @pytest.fixture(scope="class")
+    def replaced_docx(
+        self, table_docx: bytes, table_body_root: etree._Element
+    ) -> bytes:
+        """Row 1 answer paragraph replaced with a formatted run."""
+        xpath = self._get_answer_cell_xpath(table_body_root, 1)
         run_xml = (
             f'<w:r xmlns:w="{W}"><w:rPr>'
             f'<w:rFonts w:ascii="Calibri"/><w:sz w:val="20"/>'
@@ -307,15 +329,33 @@ class TestWriteAnswers:
             insertion_xml=run_xml,
             mode=InsertionMode.REPLACE_CONTENT,
         )]
+        return write_answers(table_docx, answers)
 
+    @pytest.fixture(scope="class")
+    def replaced_tc(self, table_docx: bytes) -> etree._Element:
+        """The row 1 answer w:tc after replace_content targeted the cell."""
+        xpath = "./w:tbl[1]/w:tr[2]/w:tc[2]"
+        run_xml = f'<w:r xmlns:w="{W}"><w:t>Acme Corporation</w:t></w:r>'
+        answers = [AnswerPayload(
+            pair_id="q1",
+            xpath=xpath,
+            insertion_xml=run_xml,
+            mode=InsertionMode.REPLACE_CONTENT,
+        )]
         result_bytes = write_answers(table_docx, answers)
 
+        body = get_body_element(result_bytes)
+        return body.xpath(xpath, namespaces=NAMESPACES)[0]
+
+    def test_replace_content(self, replaced_docx: bytes) -> None:
         # Verify the answer was written
-        result = extract_structure(result_bytes)
-        assert "Acme Corporation" in result.body_xml
+        doc_xml = read_document_xml(replaced_docx).decode("utf-8")
+        assert "Acme Corporation" in doc_xml
 
-    def test_append(self, table_docx: bytes) -> None:
-        xpath = self._get_answer_cell_xpath(table_docx, 1)
+    def test_append(
+        self, table_docx: bytes, table_body_root: etree._Element
+    ) -> None:
+        xpath = self._get_answer_cell_xpath(table_body_root, 1)
 
         run_xml = (
             f'<w:r xmlns:w="{W}"><w:t> (additional info)</w:t></w:r>'
@@ -328,25 +368,17 @@ class TestWriteAnswers:
         )]
 
         result_bytes = write_answers(table_docx, answers)
-        result = extract_structure(result_bytes)
-        assert "(additional info)" in result.body_xml
+        doc_xml = read_document_xml(result_bytes).decode("utf-8")
+        assert "(additional info)" in doc_xml
 
     def test_replace_placeholder(self, placeholder_docx: bytes) -> None:
         """Replace [Enter date] placeholder in the NDA form."""
-        result = extract_structure(placeholder_docx)
-        body = etree.fromstring(result.body_xml.encode("utf-8"))
+        body = get_body_element(placeholder_docx)
 
         # Find the paragraph containing "[Enter date]"
-        target_para = None
-        for p in body.iter(f"{{{W}}}p"):
-            for t in p.iter(f"{{{W}}}t"):
-                if t.text and "[Enter date]" in t.text:
-                    target_para = p
-                    break
-            if target_para is not None:
-                break
-
-        assert target_para is not None
+        matches = _FIND_PARA_WITH_TEXT(body, marker="[Enter date]")
+        assert matches
+        target_para = matches[0]
         snippet_xml = etree.tostring(target_para, encoding="unicode")
 
         locations = [LocationSnippet(pair_id="date", snippet=snippet_xml)]
@@ -362,14 +394,16 @@ class TestWriteAnswers:
         )]
 
         result_bytes = write_answers(placeholder_docx, answers)
-        result2 = extract_structure(result_bytes)
-        assert "January 15, 2026" in result2.body_xml
-        assert "[Enter date]" not in result2.body_xml
+        doc_xml = read_document_xml(result_bytes).decode("utf-8")
+        assert "January 15, 2026" in doc_xml
+        assert "[Enter date]" not in doc_xml
 
-    def test_multiple_answers(self, table_docx: bytes) -> None:
+    def test_multiple_answers(
+        self, table_docx: bytes, table_body_root: etree._Element
+    ) -> None:
         """Write answers to multiple cells at once."""
-        xpath1 = self._get_answer_cell_xpath(table_docx, 1)
-        xpath2 = self._get_answer_cell_xpath(table_docx, 2)
+        xpath1 = self._get_answer_cell_xpath(table_body_root, 1)
+        xpath2 = self._get_answer_cell_xpath(table_body_root, 2)
 
         answers = [
             AnswerPayload(
@@ -387,68 +421,43 @@ class TestWriteAnswers:
         ]
 
         result_bytes = write_answers(table_docx, answers)
-        result = extract_structure(result_bytes)
-        assert "Acme Corp" in result.body_xml
-        assert "123 Main St" in result.body_xml
+        doc_xml = read_document_xml(result_bytes).decode("utf-8")
+        assert "Acme Corp" in doc_xml
+        assert "123 Main St" in doc_xml
 
-    def test_output_is_valid_docx(self, table_docx: bytes) -> None:
+    def test_output_is_valid_docx(self, replaced_docx: bytes) -> None:
         """The output should be a valid .docx (ZIP) that we can re-extract."""
-        xpath = self._get_answer_cell_xpath(table_docx, 1)
-        answers = [AnswerPayload(
-            pair_id="q1",
-            xpath=xpath,
-            insertion_xml=f'<w:r xmlns:w="{W}"><w:t>Test</w:t></w:r>',
-            mode=InsertionMode.REPLACE_CONTENT,
-        )]
-
-        result_bytes = write_answers(table_docx, answers)
         # Should be able to extract structure from the result
-        result = extract_structure(result_bytes)
+        result = extract_structure(replaced_docx)
         assert result.body_xml is not None
 
-    def test_replace_content_preserves_tcPr(self, table_docx: bytes) -> None:
-        """replace_content on a w:tc must preserve w:tcPr (cell properties)."""
-        xpath = "./w:tbl[1]/w:tr[2]/w:tc[2]"
-        run_xml = f'<w:r xmlns:w="{W}"><w:t>Acme Corporation</w:t></w:r>'
-        answers = [AnswerPayload(
-            pair_id="q1",
-            xpath=xpath,
-            insertion_xml=run_xml,
-            mode=InsertionMode.REPLACE_CONTENT,
-        )]
+    def test_output_keeps_member_compression(
+        self, table_docx: bytes, replaced_docx: bytes
+    ) -> None:
+        """Repackaging keeps every ZIP member's original compress_type."""
+        def compress_types(docx: bytes) -> dict[str, int]:
+            with zipfile.ZipFile(BytesIO(docx)) as zf:
+                return {i.filename: i.compress_type for i in zf.infolist()}
 
-        result_bytes = write_answers(table_docx, answers)
+        assert compress_types(replaced_docx) == compress_types(table_docx)
 
-        result = extract_structure(result_bytes)
-        body = etree.fromstring(result.body_xml.encode("utf-8"))
-        tc = body.xpath(xpath, namespaces=NAMESPACES)[0]
-        assert tc.find(f"{{{W}}}tcPr") is not None, "w:tcPr was stripped"
+    def test_replace_content_preserves_tcPr(
+        self, replaced_tc: etree._Element
+    ) -> None:
+        """replace_content on a w:tc must preserve w:tcPr (cell properties)."""
+        assert replaced_tc.find(f"{{{W}}}tcPr") is not None, "w:tcPr was stripped"
 
     def test_replace_content_wraps_run_in_paragraph_for_tc(
-        self, table_docx: bytes
+        self, replaced_tc: etree._Element
     ) -> None:
         """replace_content on a w:tc must wrap w:r inside a w:p, not bare."""
-        xpath = "./w:tbl[1]/w:tr[2]/w:tc[2]"
-        run_xml = f'<w:r xmlns:w="{W}"><w:t>Acme Corporation</w:t></w:r>'
-        answers = [AnswerPayload(
-            pair_id="q1",
-            xpath=xpath,
-            insertion_xml=run_xml,
-            mode=InsertionMode.REPLACE_CONTENT,
-        )]
-
-        result_bytes = write_answers(table_docx, answers)
-
-        result = extract_structure(result_bytes)
-        body = etree.fromstring(result.body_xml.encode("utf-8"))
-        tc = body.xpath(xpath, namespaces=NAMESPACES)[0]
-
         # No bare w:r directly under w:tc
-        bare_runs = [c for c in tc if c.tag == f"{{{W}}}r"]
-        assert len(bare_runs) == 0, "w:r inserted directly under w:tc"
+        assert replaced_tc.find(f"{{{W}}}r") is None, (
+            "w:r inserted directly under w:tc"
+        )
 
         # w:p should contain the answer text
-        paras = tc.findall(f"{{{W}}}p")
+        paras = replaced_tc.findall(f"{{{W}}}p")
         assert len(paras) >= 1, "No w:p found in cell"
         assert "Acme Corporation" in etree.tostring(paras[0], encoding="unicode")
 
@@ -467,28 +476,38 @@ class TestWriteAnswers:
 
 
 class TestListFormFields:
-    def test_detects_empty_table_cells(self, table_docx: bytes) -> None:
+    @pytest.fixture(scope="class")
+    def table_fields(self, table_docx: bytes) -> list[FormField]:
         fields = list_form_fields(table_docx)
-        table_fields = [f for f in fields if f.field_type == "table_cell"]
+        return [f for f in fields if f.field_type == "table_cell"]
+
+    @pytest.fixture(scope="class")
+    def placeholder_fields(self, placeholder_docx: bytes) -> list[FormField]:
+        fields = list_form_fields(placeholder_docx)
+        return [f for f in fields if f.field_type == "placeholder"]
+
+    def test_detects_empty_table_cells(
+        self, table_fields: list[FormField]
+    ) -> None:
         # Should find the 6 empty answer cells in table 1 + 3 in table 2
         assert len(table_fields) >= 6
 
-    def test_detects_placeholder_text(self, placeholder_docx: bytes) -> None:
-        fields = list_form_fields(placeholder_docx)
-        placeholder_fields = [f for f in fields if f.field_type == "placeholder"]
+    def test_detects_placeholder_text(
+        self, placeholder_fields: list[FormField]
+    ) -> None:
         # Should find [Enter date], [Enter here] x4, [Enter number],
         # [Enter jurisdiction], ___ x3
         assert len(placeholder_fields) >= 5
 
-    def test_field_labels_contain_text(self, table_docx: bytes) -> None:
-        fields = list_form_fields(table_docx)
-        table_fields = [f for f in fields if f.field_type == "table_cell"]
+    def test_field_labels_contain_text(
+        self, table_fields: list[FormField]
+    ) -> None:
         labels = [f.label for f in table_fields]
         assert any("legal name" in l.lower() for l in labels)
 
-    def test_placeholder_fields_have_current_value(self, placeholder_docx: bytes) -> None:
-        fields = list_form_fields(placeholder_docx)
-        placeholder_fields = [f for f in fields if f.field_type == "placeholder"]
+    def test_placeholder_fields_have_current_value(
+        self, placeholder_fields: list[FormField]
+    ) -> None:
         for f in placeholder_fields:
             assert f.current_value is not None
 
@@ -514,8 +533,8 @@ class TestWriteAnswersWithAnswerText:
 
         result_bytes = write_answers(table_docx, answers)
 
-        result = extract_structure(result_bytes)
-        assert "Acme Corporation" in result.body_xml
+        doc_xml = read_document_xml(result_bytes).decode("utf-8")
+        assert "Acme Corporation" in doc_xml
 
     def test_append_with_answer_text(self, table_docx: bytes) -> None:
         """answer_text with append adds text after existing content."""
@@ -538,8 +557,8 @@ class TestWriteAnswersWithAnswerText:
         )]
         result_bytes = write_answers(filled_bytes, answers_append)
 
-        result = extract_structure(result_bytes)
-        assert "(Amended)" in result.body_xml
+        doc_xml = read_document_xml(result_bytes).decode("utf-8")
+        assert "(Amended)" in doc_xml
 
     def test_replace_placeholder_with_answer_text(
         self, placeholder_docx: bytes
@@ -556,8 +575,8 @@ class TestWriteAnswersWithAnswerText:
 
         result_bytes = write_answers(placeholder_docx, answers)
 
-        result = extract_structure(result_bytes)
-        assert "123 Security Lane, London" in result.body_xml
+        doc_xml = read_document_xml(result_bytes).decode("utf-8")
+        assert "123 Security Lane, London" in doc_xml
 
     def test_formatting_inheritance(self, table_docx: bytes) -> None:
         """Fast path inherits font family and size from the target element."""
@@ -572,8 +591,7 @@ class TestWriteAnswersWithAnswerText:
 
         result_bytes = write_answers(table_docx, answers)
 
-        result = extract_structure(result_bytes)
-        body = etree.fromstring(result.body_xml.encode("utf-8"))
+        body = get_body_element(result_bytes)
         target = body.xpath(xpath, namespaces=NAMESPACES)[0]
         run = target.find(f".//{{{W}}}r")
         assert run is not None
@@ -602,27 +620,26 @@ class TestWriteAnswersWithAnswerText:
 
         result_bytes = write_answers(table_docx, answers)
 
-        result = extract_structure(result_bytes)
-        assert "Legacy Path" in result.body_xml
+        doc_xml = read_document_xml(result_bytes).decode("utf-8")
+        assert "Legacy Path" in doc_xml
 
-    def test_parity_answer_text_vs_insertion_xml(self, table_docx: bytes) -> None:
+    def test_parity_answer_text_vs_insertion_xml(
+        self, table_body_root: etree._Element
+    ) -> None:
         """Fast path produces byte-identical XML to the old path for same input.
 
         This is the parity test: same target, same answer text, both paths
         must produce the same <w:r> element with the same formatting.
         """
-        from src.handlers.word_writer import _build_insertion_xml_for_answer_text
-        from src.handlers.word_parser import read_document_xml
-        from src.xml_utils import SECURE_PARSER
+        from src.handlers.word_writer import (
+            _build_insertion_element_for_answer_text,
+        )
 
         xpath = "./w:tbl[1]/w:tr[2]/w:tc[2]/w:p[1]"
         answer_text = "Parity Test Answer"
 
-        # Get the target element from the document
-        doc_xml = read_document_xml(table_docx)
-        root = etree.fromstring(doc_xml, SECURE_PARSER)
-        body = root.find("w:body", NAMESPACES)
-        target = body.xpath(xpath, namespaces=NAMESPACES)[0]
+        # Get the target element from the shared (read-only) body
+        target = table_body_root.xpath(xpath, namespaces=NAMESPACES)[0]
 
         # Old path: extract_formatting from XML string → build_run_xml
         target_xml = etree.tostring(target, encoding="unicode")
@@ -633,14 +650,19 @@ class TestWriteAnswersWithAnswerText:
         ))
         old_xml = old_resp.insertion_xml
 
-        # Fast path: extract_formatting_from_element → build_run_xml
-        fast_xml = _build_insertion_xml_for_answer_text(target, answer_text)
+        # Fast path: extract_formatting_from_element → build_run_element
+        fast_elem = _build_insertion_element_for_answer_text(
+            target, answer_text
+        )
+        fast_xml = etree.tostring(fast_elem, encoding="unicode")
 
         assert old_xml == fast_xml, (
             f"Parity failure!\nOld:  {old_xml}\nFast: {fast_xml}"
         )
 
-    def test_answer_text_writes_to_correct_cell(self, table_docx: bytes) -> None:
+    def test_answer_text_writes_to_correct_cell(
+        self, table_docx: bytes, table_body_root: etree._Element
+    ) -> None:
         """The fast path writes ONLY to the targeted cell, not adjacent cells.
 
         Regression test: ensures the answer appears at the XPath target
@@ -650,9 +672,7 @@ class TestWriteAnswersWithAnswerText:
         question_xpath = "./w:tbl[1]/w:tr[2]/w:tc[1]/w:p[1]"
 
         # Get the original question text before writing
-        orig = extract_structure(table_docx)
-        orig_body = etree.fromstring(orig.body_xml.encode("utf-8"))
-        orig_q = orig_body.xpath(question_xpath, namespaces=NAMESPACES)[0]
+        orig_q = table_body_root.xpath(question_xpath, namespaces=NAMESPACES)[0]
         orig_q_text = "".join(
             t.text or "" for t in orig_q.iter(f"{{{W}}}t")
         )
@@ -667,8 +687,7 @@ class TestWriteAnswersWithAnswerText:
         result_bytes = write_answers(table_docx, answers)
 
         # Verify answer landed in the right cell
-        result = extract_structure(result_bytes)
-        result_body = etree.fromstring(result.body_xml.encode("utf-8"))
+        result_body = get_body_element(result_bytes)
 
         target = result_body.xpath(answer_xpath, namespaces=NAMESPACES)[0]
         target_text = "".join(
@@ -700,9 +719,9 @@ class TestWriteAnswersWithAnswerText:
             ),
         ]
         result_bytes = write_answers(table_docx, answers)
-        result = extract_structure(result_bytes)
-        assert "Answer One" in result.body_xml
-        assert "Answer Two" in result.body_xml
+        doc_xml = read_document_xml(result_bytes).decode("utf-8")
+        assert "Answer One" in doc_xml
+        assert "Answer Two" in doc_xml
 
     def test_multiline_answer_text_produces_line_breaks(
         self, table_docx: bytes
@@ -718,8 +737,7 @@ class TestWriteAnswersWithAnswerText:
 
         result_bytes = write_answers(table_docx, answers)
 
-        result = extract_structure(result_bytes)
-        body = etree.fromstring(result.body_xml.encode("utf-8"))
+        body = get_body_element(result_bytes)
         target = body.xpath(xpath, namespaces=NAMESPACES)[0]
         run = target.find(f".//{{{W}}}r")
         assert run is not None
@@ -754,8 +772,7 @@ class TestWriteAnswersWithAnswerText:
 
         result_bytes = write_answers(table_docx, answers)
 
-        result = extract_structure(result_bytes)
-        body = etree.fromstring(result.body_xml.encode("utf-8"))
+        body = get_body_element(result_bytes)
         target = body.xpath(xpath, namespaces=NAMESPACES)[0]
         run = target.find(f".//{{{W}}}r")
 
@@ -776,18 +793,13 @@ class TestWriteAnswersWithAnswerText:
 
 
 class TestFullPipeline:
-    def test_extract_validate_build_write(self, table_docx: bytes) -> None:
+    def test_extract_validate_build_write(
+        self, table_docx: bytes, table_body_root: etree._Element
+    ) -> None:
         """Full pipeline: extract → validate → build → write."""
-        # 1. Extract structure
-        structure = extract_structure(table_docx)
-        body = etree.fromstring(structure.body_xml.encode("utf-8"))
-
+        # 1. Extract structure (shared session-wide via table_body_root)
         # 2. Find the question cell for the first question (unique text)
-        first_tbl = body.find(".//w:tbl", NAMESPACES)
-        rows = first_tbl.findall("w:tr", NAMESPACES)
-        q_cell = rows[1].findall("w:tc", NAMESPACES)[0]
-        q_para = q_cell.find("w:p", NAMESPACES)
-        snippet = etree.tostring(q_para, encoding="unicode")
+        snippet = _question_snippet(table_body_root, 1)
 
         # 3. Validate location of the question paragraph
         validated = validate_locations(
@@ -797,10 +809,9 @@ class TestFullPipeline:
         assert validated[0].status == LocationStatus.MATCHED
 
         # 4. Build insertion XML (inherit formatting from the question cell)
-        context_xml = etree.tostring(q_para, encoding="unicode")
         build_resp = build_insertion_xml(BuildInsertionXmlRequest(
             answer_text="Acme Corporation Ltd.",
-            target_context_xml=context_xml,
+            target_context_xml=snippet,
             answer_type=AnswerType.PLAIN_TEXT,
         ))
         assert build_resp.valid
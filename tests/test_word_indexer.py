@@ -1,163 +1,184 @@
 """Tests for the Word compact extraction / indexer module."""
 
-from pathlib import Path
+import re
 
 import pytest
 from lxml import etree
 
 from src.handlers.word_indexer import extract_structure_compact
+from src.handlers.word_parser import get_body_element, get_body_xml
 from src.models import CompactStructureResponse
 from src.xml_utils import NAMESPACES
 
-FIXTURES = Path(__file__).parent / "fixtures"
-INPUTS = Path(__file__).parent / "inputs"
+from tests.conftest import compact_lines_by_id
+
 W = NAMESPACES["w"]
 
 
-@pytest.fixture
-def table_docx() -> bytes:
-    return (FIXTURES / "table_questionnaire.docx").read_bytes()
+@pytest.fixture(scope="session")
+def table_body(table_docx: bytes) -> etree._Element:
+    """Parsed w:body of the questionnaire (shared, read-only)."""
+    return get_body_element(table_docx)
+
+
+@pytest.fixture(scope="session")
+def vendor_body(vendor_docx: bytes) -> etree._Element:
+    """Parsed w:body of the vendor questionnaire (shared, read-only)."""
+    return get_body_element(vendor_docx)
+
 
+# Session-scoped: CompactStructureResponse is only read by these tests, so
+# each input is extracted once and shared.
+@pytest.fixture(scope="session")
+def table_compact(table_docx: bytes) -> CompactStructureResponse:
+    return extract_structure_compact(table_docx)
 
-@pytest.fixture
-def placeholder_docx() -> bytes:
-    return (FIXTURES / "placeholder_form.docx").read_bytes()
 
+@pytest.fixture(scope="session")
+def placeholder_compact(placeholder_docx: bytes) -> CompactStructureResponse:
+    return extract_structure_compact(placeholder_docx)
 
-@pytest.fixture
-def vendor_docx() -> bytes:
-    return (INPUTS / "Vendor_Questionnaire.docx").read_bytes()
+
+@pytest.fixture(scope="session")
+def vendor_compact(vendor_docx: bytes) -> CompactStructureResponse:
+    return extract_structure_compact(vendor_docx)
 
 
 # ── Return type and shape ───────────────────────────────────────────────────
 
 
 class TestReturnShape:
-    def test_returns_compact_structure_response(self, table_docx: bytes) -> None:
-        result = extract_structure_compact(table_docx)
-        assert isinstance(result, CompactStructureResponse)
+    def test_returns_compact_structure_response(
+        self, table_compact: CompactStructureResponse
+    ) -> None:
+        assert isinstance(table_compact, CompactStructureResponse)
 
-    def test_has_compact_text(self, table_docx: bytes) -> None:
-        result = extract_structure_compact(table_docx)
-        assert isinstance(result.compact_text, str)
-        assert len(result.compact_text) > 0
+    def test_has_compact_text(self, table_compact: CompactStructureResponse) -> None:
+        assert isinstance(table_compact.compact_text, str)
+        assert len(table_compact.compact_text) > 0
 
-    def test_has_id_to_xpath_mapping(self, table_docx: bytes) -> None:
-        result = extract_structure_compact(table_docx)
-        assert isinstance(result.id_to_xpath, dict)
-        assert len(result.id_to_xpath) > 0
+    def test_has_id_to_xpath_mapping(
+        self, table_compact: CompactStructureResponse
+    ) -> None:
+        assert isinstance(table_compact.id_to_xpath, dict)
+        assert len(table_compact.id_to_xpath) > 0
 
-    def test_has_complex_elements_list(self, table_docx: bytes) -> None:
-        result = extract_structure_compact(table_docx)
-        assert isinstance(result.complex_elements, list)
+    def test_has_complex_elements_list(
+        self, table_compact: CompactStructureResponse
+    ) -> None:
+        assert isinstance(table_compact.complex_elements, list)
 
 
 # ── Element ID scheme ───────────────────────────────────────────────────────
 
 
 class TestElementIdScheme:
-    def test_paragraph_ids_are_p_numbered(self, table_docx: bytes) -> None:
+    def test_paragraph_ids_are_p_numbered(
+        self, table_compact: CompactStructureResponse
+    ) -> None:
         """Top-level paragraphs get IDs like P1, P2, etc."""
-        result = extract_structure_compact(table_docx)
-        p_ids = [k for k in result.id_to_xpath if k.startswith("P")]
-        assert len(p_ids) > 0
+        assert any(k.startswith("P") for k in table_compact.id_to_xpath)
         # Should be sequential
-        assert "P1" in result.id_to_xpath
+        assert "P1" in table_compact.id_to_xpath
 
-    def test_table_cell_ids_are_t_r_c_numbered(self, table_docx: bytes) -> None:
+    def test_table_cell_ids_are_t_r_c_numbered(
+        self, table_compact: CompactStructureResponse
+    ) -> None:
         """Table cells get IDs like T1-R1-C1."""
-        result = extract_structure_compact(table_docx)
-        tc_ids = [k for k in result.id_to_xpath if k.startswith("T")]
-        assert len(tc_ids) > 0
-        assert "T1-R1-C1" in result.id_to_xpath
+        assert any(k.startswith("T") for k in table_compact.id_to_xpath)
+        assert "T1-R1-C1" in table_compact.id_to_xpath
 
-    def test_all_ids_appear_in_compact_text(self, table_docx: bytes) -> None:
+    def test_all_ids_appear_in_compact_text(
+        self, table_compact: CompactStructureResponse
+    ) -> None:
         """Every ID in the mapping should appear in the compact text."""
-        result = extract_structure_compact(table_docx)
-        for element_id in result.id_to_xpath:
-            assert element_id in result.compact_text, (
-                f"ID {element_id} is in mapping but missing from compact_text"
-            )
+        found = set(compact_lines_by_id(table_compact.compact_text))
+        missing = set(table_compact.id_to_xpath) - found
+        assert not missing, (
+            f"IDs {sorted(missing)} are in mapping but missing from compact_text"
+        )
 
 
 # ── Text content ────────────────────────────────────────────────────────────
 
 
 class TestTextContent:
-    def test_contains_question_text(self, table_docx: bytes) -> None:
-        result = extract_structure_compact(table_docx)
-        assert "full legal name" in result.compact_text.lower()
+    def test_contains_question_text(
+        self, table_compact: CompactStructureResponse
+    ) -> None:
+        assert "full legal name" in table_compact.compact_text.lower()
 
-    def test_contains_vendor_section_headers(self, vendor_docx: bytes) -> None:
-        result = extract_structure_compact(vendor_docx)
-        assert "General Company Information" in result.compact_text
-        assert "Data Protection" in result.compact_text
+    def test_contains_vendor_section_headers(
+        self, vendor_compact: CompactStructureResponse
+    ) -> None:
+        assert "General Company Information" in vendor_compact.compact_text
+        assert "Data Protection" in vendor_compact.compact_text
 
-    def test_contains_vendor_question_text(self, vendor_docx: bytes) -> None:
-        result = extract_structure_compact(vendor_docx)
-        assert "full legal company name" in result.compact_text.lower()
+    def test_contains_vendor_question_text(
+        self, vendor_compact: CompactStructureResponse
+    ) -> None:
+        assert "full legal company name" in vendor_compact.compact_text.lower()
 
 
 # ── Formatting hints ────────────────────────────────────────────────────────
 
 
 class TestFormattingHints:
-    def test_bold_is_detected(self, table_docx: bytes) -> None:
+    def test_bold_is_detected(self, table_compact: CompactStructureResponse) -> None:
         """Header row cells are bold; should have [bold] hint."""
-        result = extract_structure_compact(table_docx)
-        # The header row has "Question" and "Answer" in bold
-        lines = result.compact_text.split("\n")
-        header_lines = [l for l in lines if "Question" in l or "Answer" in l]
-        assert any("bold" in l for l in header_lines)
+        # The header row has "Question" and "Answer" in bold; "." stops at
+        # newlines, so the hint must be on the same line as the header text
+        assert re.search(
+            r"^.*(Question|Answer).*bold", table_compact.compact_text, re.MULTILINE
+        )
 
 
 # ── Answer target detection ─────────────────────────────────────────────────
 
 
 class TestAnswerTargets:
-    def test_empty_cells_marked_as_targets(self, table_docx: bytes) -> None:
-        result = extract_structure_compact(table_docx)
-        assert "answer target" in result.compact_text.lower()
+    def test_empty_cells_marked_as_targets(
+        self, table_compact: CompactStructureResponse
+    ) -> None:
+        assert "answer target" in table_compact.compact_text.lower()
 
-    def test_empty_cells_marked_as_empty(self, table_docx: bytes) -> None:
-        result = extract_structure_compact(table_docx)
-        assert "empty" in result.compact_text.lower()
+    def test_empty_cells_marked_as_empty(
+        self, table_compact: CompactStructureResponse
+    ) -> None:
+        assert "empty" in table_compact.compact_text.lower()
 
-    def test_placeholder_text_detected(self, placeholder_docx: bytes) -> None:
-        result = extract_structure_compact(placeholder_docx)
-        assert "placeholder" in result.compact_text.lower()
+    def test_placeholder_text_detected(
+        self, placeholder_compact: CompactStructureResponse
+    ) -> None:
+        assert "placeholder" in placeholder_compact.compact_text.lower()
 
 
 # ── XPath validity ──────────────────────────────────────────────────────────
 
 
 class TestXPathValidity:
-    def test_xpaths_resolve_to_elements(self, table_docx: bytes) -> None:
+    def test_xpaths_resolve_to_elements(
+        self, table_compact: CompactStructureResponse, table_body: etree._Element
+    ) -> None:
         """Every XPath in the mapping should resolve to a real element."""
-        from src.handlers.word_parser import get_body_xml
-
-        result = extract_structure_compact(table_docx)
-        body_xml = get_body_xml(table_docx)
-        body = etree.fromstring(body_xml.encode("utf-8"))
+        evaluate = etree.XPathEvaluator(table_body, namespaces=NAMESPACES)
 
-        for element_id, xpath in result.id_to_xpath.items():
-            matched = body.xpath(xpath, namespaces=NAMESPACES)
+        for element_id, xpath in table_compact.id_to_xpath.items():
+            matched = evaluate(xpath)
             assert len(matched) == 1, (
                 f"XPath for {element_id} ({xpath}) matched "
                 f"{len(matched)} elements, expected 1"
             )
 
-    def test_vendor_xpaths_resolve(self, vendor_docx: bytes) -> None:
+    def test_vendor_xpaths_resolve(
+        self, vendor_compact: CompactStructureResponse, vendor_body: etree._Element
+    ) -> None:
         """XPaths work on the larger vendor questionnaire too."""
-        from src.handlers.word_parser import get_body_xml
-
-        result = extract_structure_compact(vendor_docx)
-        body_xml = get_body_xml(vendor_docx)
-        body = etree.fromstring(body_xml.encode("utf-8"))
+        evaluate = etree.XPathEvaluator(vendor_body, namespaces=NAMESPACES)
 
         failed = []
-        for element_id, xpath in result.id_to_xpath.items():
-            matched = body.xpath(xpath, namespaces=NAMESPACES)
+        for element_id, xpath in vendor_compact.id_to_xpath.items():
+            matched = evaluate(xpath)
             if len(matched) != 1:
                 failed.append(f"{element_id}: {xpath} -> {len(matched)} matches")
 
@@ -168,15 +189,12 @@ class TestXPathValidity:
 
 
 class TestCompactSize:
-    def test_much_smaller_than_raw_xml(self, vendor_docx: bytes) -> None:
+    def test_much_smaller_than_raw_xml(
+        self, vendor_docx: bytes, vendor_compact: CompactStructureResponse
+    ) -> None:
         """Compact output should be much smaller than raw OOXML."""
-        from src.handlers.word import extract_structure
-
-        compact = extract_structure_compact(vendor_docx)
-        raw = extract_structure(vendor_docx)
-
-        compact_size = len(compact.compact_text)
-        raw_size = len(raw.body_xml)
+        compact_size = len(vendor_compact.compact_text)
+        raw_size = len(get_body_xml(vendor_docx))
 
         # Compact should be at most 10% of raw size
         assert compact_size < raw_size * 0.1, (
@@ -184,23 +202,24 @@ class TestCompactSize:
             f"than raw ({raw_size})"
         )
 
-    def test_compact_text_under_15kb(self, vendor_docx: bytes) -> None:
+    def test_compact_text_under_15kb(
+        self, vendor_compact: CompactStructureResponse
+    ) -> None:
         """The compact text for the vendor questionnaire should be under 15KB."""
-        result = extract_structure_compact(vendor_docx)
-        assert len(result.compact_text) < 15_000
+        assert len(vendor_compact.compact_text) < 15_000
 
 
 # ── Simple documents have no complex elements ──────────────────────────────
 
 
 class TestComplexElements:
-    def test_simple_table_has_no_complex_elements(self, table_docx: bytes) -> None:
-        result = extract_structure_compact(table_docx)
-        assert result.complex_elements == []
+    def test_simple_table_has_no_complex_elements(
+        self, table_compact: CompactStructureResponse
+    ) -> None:
+        assert table_compact.complex_elements == []
 
     def test_vendor_questionnaire_has_no_complex_elements(
-        self, vendor_docx: bytes
+        self, vendor_compact: CompactStructureResponse
     ) -> None:
         """The vendor questionnaire is simple tables — no complex elements."""
-        result = extract_structure_compact(vendor_docx)
-        assert result.complex_elements == []
+        assert vendor_compact.complex_elements == []
@@ -1,7 +1,5 @@
 """Tests for the Word (.docx) output verifier."""
 
-from pathlib import Path
-
 import pytest
 from lxml import etree
 
@@ -13,18 +11,14 @@ from src.models import (
     ExpectedAnswer,
     InsertionMode,
 )
-from src.xml_utils import NAMESPACES
+from src.xml_utils import NAMESPACES, SECURE_PARSER, W_R, W_T, W_TC
 
-FIXTURES = Path(__file__).parent / "fixtures"
 W = NAMESPACES["w"]
 
 
-@pytest.fixture
-def table_docx() -> bytes:
-    return (FIXTURES / "table_questionnaire.docx").read_bytes()
-
-
-@pytest.fixture
+# Session-scoped: write_answers and verify_output return new bytes and never
+# modify their input, so the filled document is built once.
+@pytest.fixture(scope="session")
 def filled_docx(table_docx: bytes) -> bytes:
     """A table_questionnaire.docx with two answers written into it."""
     answers = [
@@ -44,6 +38,12 @@ def filled_docx(table_docx: bytes) -> bytes:
     return write_answers(table_docx, answers)
 
 
+@pytest.fixture(scope="session")
+def malformed_docx(table_docx: bytes) -> bytes:
+    """A table_questionnaire.docx with a bare w:r under its first w:tc."""
+    return _make_malformed_docx(table_docx)
+
+
 class TestVerifyOutputContentAllMatched:
     def test_all_matched(self, filled_docx: bytes) -> None:
         """All expected answers match the actual content."""
@@ -146,13 +146,12 @@ class TestVerifyOutputContentMissing:
 
 
 class TestVerifyOutputStructuralIssues:
-    def test_bare_run_under_tc_detected(self, table_docx: bytes) -> None:
+    def test_bare_run_under_tc_detected(self, malformed_docx: bytes) -> None:
         """A document with a bare w:r under w:tc should report a structural issue.
 
         We craft a malformed docx by manually inserting a bare run into a cell.
         """
-        malformed = _make_malformed_docx(table_docx)
-        report = verify_output(malformed, [])
+        report = verify_output(malformed_docx, [])
 
         assert report.summary.structural_issues > 0
         assert any(
@@ -178,33 +177,35 @@ def _make_malformed_docx(file_bytes: bytes) -> bytes:
     """Create a docx with a bare w:r directly under a w:tc (invalid OOXML).
 
     Takes a valid docx, parses document.xml, finds the first table cell,
-    and appends a bare w:r element as a direct child of w:tc.
+    and appends a bare w:r element as a direct child of w:tc. The input
+    archive is opened once for both the read and the copy.
     """
     import zipfile
     from io import BytesIO
 
-    with zipfile.ZipFile(BytesIO(file_bytes)) as zf:
-        doc_xml = zf.read("word/document.xml")
-
-    root = etree.fromstring(doc_xml)
-    body = root.find("w:body", NAMESPACES)
-
-    # Find first table cell and add a bare run (not wrapped in w:p)
-    first_tc = body.find(".//w:tc", NAMESPACES)
-    bare_run = etree.SubElement(first_tc, f"{{{W}}}r")
-    bare_t = etree.SubElement(bare_run, f"{{{W}}}t")
-    bare_t.text = "bare run"
-
-    modified_xml = etree.tostring(
-        root, xml_declaration=True, encoding="UTF-8", standalone=True
-    )
-
     output = BytesIO()
     with zipfile.ZipFile(BytesIO(file_bytes)) as zf_in:
+        modified_xml = _add_bare_run(zf_in.read("word/document.xml"))
         with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zf_out:
             for item in zf_in.infolist():
                 if item.filename == "word/document.xml":
                     zf_out.writestr(item, modified_xml)
                 else:
-                    zf_out.writestr(item, zf_in.read(item.filename))
+                    zf_out.writestr(item, zf_in.read(item))
     return output.getvalue()
+
+
+def _add_bare_run(doc_xml: bytes) -> bytes:
+    """Return doc_xml with a bare w:r appended to the first table cell."""
+    root = etree.fromstring(doc_xml, SECURE_PARSER)
+    body = root.find("w:body", NAMESPACES)
+
+    # Find first table cell and add a bare run (not wrapped in w:p)
+    first_tc = next(body.iter(W_TC))
+    bare_run = etree.SubElement(first_tc, W_R)
+    bare_t = etree.SubElement(bare_run, W_T)
+    bare_t.text = "bare run"
+
+    return etree.tostring(
+        root, xml_declaration=True, encoding="UTF-8", standalone=True
+    )
@@ -8,23 +8,33 @@ from src.xml_formatting import (
 )
 from src.xml_utils import (
     NAMESPACES,
+    SECURE_PARSER,
+    W_BR,
+    W_P,
+    W_R,
+    W_RPR,
+    W_T,
+    build_run_element,
     build_run_xml,
     extract_formatting,
+    SnippetIndex,
     find_snippet_in_body,
+    find_snippet_in_tree,
     is_well_formed_ooxml,
 )
 
 W = NAMESPACES["w"]
 
 
-def _make_body(*children_xml: str) -> str:
-    """Wrap child XML strings in a <w:body> element with namespace declarations."""
+def _make_body(*children_xml: str) -> etree._Element:
+    """Wrap child XML strings in a <w:body> element and parse it."""
     inner = "".join(children_xml)
-    return (
+    body_xml = (
         f'<w:body xmlns:w="{W}" '
         f'xmlns:r="{NAMESPACES["r"]}">'
         f"{inner}</w:body>"
     )
+    return etree.fromstring(body_xml, SECURE_PARSER)
 
 
 def _make_paragraph(text: str, font: str = "Calibri", sz: str = "20") -> str:
@@ -37,10 +47,25 @@ def _make_paragraph(text: str, font: str = "Calibri", sz: str = "20") -> str:
     )
 
 
+# Bodies shared by several tests, parsed once at import time (read-only).
+HELLO_BODY = _make_body(_make_paragraph("Hello"))
+ONE_TWO_BODY = _make_body(_make_paragraph("One"), _make_paragraph("Two"))
+
+
 class TestFindSnippetInBody:
+    def test_parses_body_string_and_matches(self) -> None:
+        body_xml = etree.tostring(ONE_TWO_BODY, encoding="unicode")
+        snippet = (
+            f'<w:p xmlns:w="{W}">'
+            f'<w:r><w:rPr><w:rFonts w:ascii="Calibri"/>'
+            f'<w:sz w:val="20"/></w:rPr>'
+            f"<w:t>Two</w:t></w:r></w:p>"
+        )
+        assert find_snippet_in_body(body_xml, snippet) == ["./w:p[2]"]
+
+
+class TestFindSnippetInTree:
     def test_finds_exact_match(self) -> None:
-        para = _make_paragraph("Hello")
-        body = _make_body(para)
         # The snippet as it would appear (with namespace prefix)
         snippet = (
             f'<w:p xmlns:w="{W}">'
@@ -48,17 +73,15 @@ class TestFindSnippetInBody:
             f'<w:sz w:val="20"/></w:rPr>'
             f"<w:t>Hello</w:t></w:r></w:p>"
         )
-        matches = find_snippet_in_body(body, snippet)
+        matches = find_snippet_in_tree(HELLO_BODY, snippet)
         assert len(matches) == 1
 
     def test_no_match(self) -> None:
-        para = _make_paragraph("Hello")
-        body = _make_body(para)
         snippet = (
             f'<w:p xmlns:w="{W}">'
             f"<w:r><w:rPr/><w:t>Goodbye</w:t></w:r></w:p>"
         )
-        matches = find_snippet_in_body(body, snippet)
+        matches = find_snippet_in_tree(HELLO_BODY, snippet)
         assert len(matches) == 0
 
     def test_ambiguous_match(self) -> None:
@@ -70,7 +93,7 @@ class TestFindSnippetInBody:
             f'<w:sz w:val="20"/></w:rPr>'
             f"<w:t>Same text</w:t></w:r></w:p>"
         )
-        matches = find_snippet_in_body(body, snippet)
+        matches = find_snippet_in_tree(body, snippet)
         assert len(matches) == 2
 
     def test_snippet_without_namespace_decl(self) -> None:
@@ -83,7 +106,7 @@ class TestFindSnippetInBody:
             '<w:sz w:val="20"/></w:rPr>'
             "<w:t>Test</w:t></w:r></w:p>"
         )
-        matches = find_snippet_in_body(body, snippet)
+        matches = find_snippet_in_tree(body, snippet)
         assert len(matches) == 1
 
     def test_matches_run_level(self) -> None:
@@ -95,14 +118,22 @@ class TestFindSnippetInBody:
             f'<w:sz w:val="20"/></w:rPr>'
             f"<w:t>RunMatch</w:t></w:r>"
         )
-        matches = find_snippet_in_body(body, snippet)
+        matches = find_snippet_in_tree(body, snippet)
         assert len(matches) == 1
 
     def test_invalid_snippet_returns_empty(self) -> None:
         body = _make_body(_make_paragraph("X"))
-        matches = find_snippet_in_body(body, "<not valid xml>>>")
+        matches = find_snippet_in_tree(body, "<not valid xml>>>")
         assert matches == []
 
+    def test_shared_index_across_snippets(self) -> None:
+        index: SnippetIndex = {}
+        first = find_snippet_in_tree(ONE_TWO_BODY, _make_paragraph("Two"), index)
+        second = find_snippet_in_tree(ONE_TWO_BODY, _make_paragraph("One"), index)
+        assert first == ["./w:p[2]"]
+        assert second == ["./w:p[1]"]
+        assert list(index) == [W_P]
+
 
 class TestExtractFormatting:
     def test_extracts_font_and_size(self) -> None:
@@ -164,21 +195,30 @@ class TestExtractFormatting:
 
 
 class TestBuildRunXml:
+    """build_run_xml output has no XML declaration, so tests parse the str as-is."""
+
     def test_plain_text_no_formatting(self) -> None:
         xml = build_run_xml("Hello", {})
-        elem = etree.fromstring(xml.encode("utf-8"))
-        assert elem.tag == f"{{{W}}}r"
-        t = elem.find(f"{{{W}}}t")
+        elem = etree.fromstring(xml, SECURE_PARSER)
+        assert elem.tag == W_R
+        t = elem.find(W_T)
         assert t is not None
         assert t.text == "Hello"
         # No rPr when no formatting
-        assert elem.find(f"{{{W}}}rPr") is None
+        assert elem.find(W_RPR) is None
+
+    def test_matches_serialized_run_element(self) -> None:
+        fmt = {"font_ascii": "Arial", "bold": True}
+        elem = build_run_element("Line 1\nLine 2", fmt)
+        assert etree.tostring(elem, encoding="unicode") == build_run_xml(
+            "Line 1\nLine 2", fmt
+        )
 
     def test_with_formatting(self) -> None:
         fmt = {"font_ascii": "Arial", "sz": "24", "bold": True}
         xml = build_run_xml("Formatted", fmt)
-        elem = etree.fromstring(xml.encode("utf-8"))
-        rpr = elem.find(f"{{{W}}}rPr")
+        elem = etree.fromstring(xml, SECURE_PARSER)
+        rpr = elem.find(W_RPR)
         assert rpr is not None
         assert rpr.find(f"{{{W}}}rFonts") is not None
         assert rpr.find(f"{{{W}}}rFonts").get(f"{{{W}}}ascii") == "Arial"
@@ -187,52 +227,48 @@ class TestBuildRunXml:
 
     def test_preserves_leading_trailing_spaces(self) -> None:
         xml = build_run_xml(" spaced ", {})
-        elem = etree.fromstring(xml.encode("utf-8"))
-        t = elem.find(f"{{{W}}}t")
+        elem = etree.fromstring(xml, SECURE_PARSER)
+        t = elem.find(W_T)
         assert t.get("{http://www.w3.org/XML/1998/namespace}space") == "preserve"
 
     def test_output_is_well_formed(self) -> None:
         fmt = {"font_ascii": "Calibri", "font_hAnsi": "Calibri", "sz": "22", "italic": True}
         xml = build_run_xml("test", fmt)
         # Should parse without error
-        etree.fromstring(xml.encode("utf-8"))
+        etree.fromstring(xml, SECURE_PARSER)
 
     def test_newlines_become_br_elements(self) -> None:
         xml = build_run_xml("Line 1\nLine 2\nLine 3", {})
-        elem = etree.fromstring(xml.encode("utf-8"))
-        t_elems = elem.findall(f"{{{W}}}t")
-        br_elems = elem.findall(f"{{{W}}}br")
-        assert len(t_elems) == 3
-        assert len(br_elems) == 2
-        assert t_elems[0].text == "Line 1"
-        assert t_elems[1].text == "Line 2"
-        assert t_elems[2].text == "Line 3"
+        elem = etree.fromstring(xml, SECURE_PARSER)
+        # One pass over the children checks tag order and text together
+        children = list(elem)
+        assert [c.tag for c in children] == [W_T, W_BR, W_T, W_BR, W_T]
+        assert [c.text for c in children[::2]] == ["Line 1", "Line 2", "Line 3"]
 
     def test_single_line_no_br(self) -> None:
         xml = build_run_xml("No newlines here", {})
-        elem = etree.fromstring(xml.encode("utf-8"))
-        assert len(elem.findall(f"{{{W}}}br")) == 0
-        assert len(elem.findall(f"{{{W}}}t")) == 1
+        elem = etree.fromstring(xml, SECURE_PARSER)
+        assert [c.tag for c in elem] == [W_T]
 
     def test_literal_escaped_newlines_become_br(self) -> None:
         """Literal backslash-n (two chars) as sent by Gemini becomes <w:br/>."""
         text = "25 Technology Park\\nReading, Berkshire\\nRG6 1PT"
         xml = build_run_xml(text, {})
-        elem = etree.fromstring(xml.encode("utf-8"))
-        t_elems = elem.findall(f"{{{W}}}t")
-        br_elems = elem.findall(f"{{{W}}}br")
-        assert len(t_elems) == 3
-        assert len(br_elems) == 2
-        assert t_elems[0].text == "25 Technology Park"
-        assert t_elems[1].text == "Reading, Berkshire"
-        assert t_elems[2].text == "RG6 1PT"
+        elem = etree.fromstring(xml, SECURE_PARSER)
+        children = list(elem)
+        assert [c.tag for c in children] == [W_T, W_BR, W_T, W_BR, W_T]
+        assert [c.text for c in children[::2]] == [
+            "25 Technology Park",
+            "Reading, Berkshire",
+            "RG6 1PT",
+        ]
 
     def test_mixed_real_and_escaped_newlines(self) -> None:
         """Both real newlines and literal backslash-n in the same string."""
         text = "Line A\\nLine B\nLine C"
         xml = build_run_xml(text, {})
-        elem = etree.fromstring(xml.encode("utf-8"))
-        t_elems = elem.findall(f"{{{W}}}t")
+        elem = etree.fromstring(xml, SECURE_PARSER)
+        t_elems = elem.findall(W_T)
         assert len(t_elems) == 3
         assert [t.text for t in t_elems] == ["Line A", "Line B", "Line C"]
 